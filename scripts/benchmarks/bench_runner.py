@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 from __future__ import annotations
 import argparse
+import atexit
 import csv
+import functools
 import os
 import platform
 import random
@@ -11,10 +13,16 @@ import subprocess
 import sys
 import tempfile
 import time
+from collections import deque
+from concurrent.futures import Executor, Future
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Set, Tuple, Union, Callable, TypedDict
+from typing import Any, Deque, Dict, FrozenSet, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Set, TextIO, Tuple, Union, Callable, TypedDict
 import hashlib
+import itertools
 import json
+import lzma
+import operator
+import shutil
 
 # Load xz path from paths.json if available
 XZ_PATH = "xz"  # default
@@ -68,6 +76,19 @@ class AlgorithmRegistryEntry(TypedDict, total=False):
 
 Params = Dict[str, str]
 
+class RunTask(TypedDict):
+    """One planned execution in config mode (picklable for the process pool)."""
+    cmd: List[str]
+    input: Path
+    log: Path
+    log_header: str
+    memlimit_mb: Optional[int]
+    required_keys: List[str]
+    warmup_runs: int
+    warmup_seconds: float
+    cold: bool
+    verbose: bool
+
 # -------------- Utility helpers --------------
 
 def vprint(enabled: bool, *args: object) -> None:
@@ -82,15 +103,37 @@ def ensure_out_dir(out_dir: Path) -> None:
 # (binary discovery is handled via _discover_bin_by_name and registry-provided lists)
 
 
+BENCH_SUFFIXES = (".cnf", ".cnf.xz")
+
+
+def _iter_bench_paths(bench_dir: Path) -> Iterator[str]:
+    # str paths of *.cnf / *.cnf.xz under bench_dir; suffixes are tested on entry names and
+    # type checks hit the DirEntry cache, so no per-file stat() is issued
+    stack = [str(bench_dir)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(BENCH_SUFFIXES) and entry.is_file():
+                        yield entry.path
+                except OSError:
+                    continue
+
+
+def iter_bench_files(bench_dir: Path) -> Iterator[Path]:
+    """Lazily yield *.cnf / *.cnf.xz files under bench_dir (recursive, unordered), using os.scandir."""
+    return map(Path, _iter_bench_paths(bench_dir))
+
+
 def list_bench_files(bench_dir: Path) -> List[Path]:
-    pats = ("*.cnf", "*.cnf.xz")
-    files: List[Path] = []
-    for root, _dirs, _files in os.walk(bench_dir):
-        for p in pats:
-            for f in Path(root).glob(p):
-                files.append(f)
-    files.sort()
-    return files
+    # Sort the str paths by component (same order as sorting Path objects, without Path comparisons)
+    return [Path(p) for p in sorted(_iter_bench_paths(bench_dir), key=lambda p: p.split(os.sep))]
 
 
 def load_hash_to_filename_map(bench_dir: Path, verbose: bool = False) -> Dict[str, str]:
@@ -111,11 +154,20 @@ def load_hash_to_filename_map(bench_dir: Path, verbose: bool = False) -> Dict[st
     return hash_map
 
 
+def _index_by_name(files: Sequence[Path]) -> Dict[str, Path]:
+    """Map basename -> path; on duplicate basenames the first path in `files` wins."""
+    by_name: Dict[str, Path] = {}
+    for p in files:
+        by_name.setdefault(p.name, p)
+    return by_name
+
+
 def select_files(all_files: Sequence[Path], n: int, reuse_csv: Optional[Path], bench_dir: Path, verbose: bool, hashes: Optional[List[str]] = None) -> List[Path]:
     # Priority 1: Select by hashes if provided
     if hashes is not None:
         vprint(verbose, f"[DEBUG] Selecting files by {len(hashes)} hashes")
         hash_to_filename = load_hash_to_filename_map(bench_dir, verbose)
+        by_name = _index_by_name(all_files)
         sel: List[Path] = []
         
         for i, hash_val in enumerate(hashes):
@@ -132,13 +184,8 @@ def select_files(all_files: Sequence[Path], n: int, reuse_csv: Optional[Path], b
             # So we need to look for files that match either:
             # 1. {hash}-{filename} (new format)
             # 2. {filename} (old format, for backward compatibility)
-            found = None
             expected_name_with_hash = f"{hash_val}-{filename}"
-            
-            for p in all_files:
-                if p.name == expected_name_with_hash or p.name == filename:
-                    found = p
-                    break
+            found = by_name.get(expected_name_with_hash) or by_name.get(filename)
             
             if found:
                 vprint(verbose, f"[DEBUG]   -> Found file in benchmarks/: {found}")
@@ -157,31 +204,25 @@ def select_files(all_files: Sequence[Path], n: int, reuse_csv: Optional[Path], b
     if reuse_csv is not None:
         if not reuse_csv.is_file():
             raise FileNotFoundError(f"Reuse CSV not found: {reuse_csv}")
-        bases: List[str] = []
-        with reuse_csv.open() as f:
+        bases: Set[str] = set()
+        with reuse_csv.open(newline="") as f:
             reader = csv.reader(f)
             next(reader, None)  # header
             for row in reader:
                 if not row: continue
-                bases.append(row[0])
-        uniq = sorted(set(bases))
+                bases.add(row[0])
+        by_name = _index_by_name(all_files)
         sel: List[Path] = []
-        for bn in uniq:
-            found = None
-            for p in all_files:
-                if p.name == bn:
-                    found = p
-                    break
+        for bn in sorted(bases):
+            found = by_name.get(bn)
             if found:
                 sel.append(found)
             else:
                 vprint(verbose, f"[warn] Not found in benchmarks/: {bn}")
         vprint(verbose, f"Reusing {len(sel)} files from CSV: {reuse_csv} (ignoring -n)")
         return sel
-    # Priority 3: random pick N
-    shuf = list(all_files)
-    random.shuffle(shuf)
-    sel = shuf[:n]
+    # Priority 3: random pick N (O(n) selection sampling; no full-list shuffle)
+    sel = random.sample(all_files, max(0, min(n, len(all_files))))
     vprint(verbose, f"Selected {len(sel)} random files (requested -n {n})")
     return sel
 
@@ -189,58 +230,313 @@ def select_files(all_files: Sequence[Path], n: int, reuse_csv: Optional[Path], b
 # (tau-specific normalization removed; rely on generic schema constraints such as allow_inf, numeric, min/max)
 
 
-def build_keys_set(csv_path: Path, key_cols: Sequence[int]) -> Optional[Set[str]]:
+RowKey = Tuple[str, ...]
+
+
+# Column kinds for precomputed CSV column plans: runner-filled file / memlimit_mb, or a value lookup
+COL_FILE, COL_MEM, COL_LOOKUP = 0, 1, 2
+ColumnPlan = List[Tuple[int, str]]
+
+
+def _column_plan(columns: Sequence[str]) -> ColumnPlan:
+    """Classify CSV columns once so per-run row building dispatches on small ints, not string compares."""
+    return [(COL_FILE if c == "file" else COL_MEM if c == "memlimit_mb" else COL_LOOKUP, c) for c in columns]
+
+
+def _build_row(plan: ColumnPlan, display_base: str, ml: Optional[int], m: Mapping[str, str], params: Mapping[str, str]) -> List[str]:
+    """CSV row for a finished run: parsed summary values first, then params, else ""."""
+    ml_s = "" if ml is None else str(ml)
+    return [display_base if kind == COL_FILE else ml_s if kind == COL_MEM else m.get(c, params.get(c, ""))
+            for kind, c in plan]
+
+
+def _row_key(key_plan: ColumnPlan, display_base: str, ml: Optional[int], values: Mapping[str, str]) -> RowKey:
+    """Key tuple for a planned run, built from the key columns' plan (file/memlimit_mb are runner-filled)."""
+    ml_s = "" if ml is None else str(ml)
+    return tuple(display_base if kind == COL_FILE else ml_s if kind == COL_MEM else values.get(c, "")
+                 for kind, c in key_plan)
+
+
+def build_keys_set(csv_path: Path, key_cols: Sequence[int]) -> Optional[FrozenSet[RowKey]]:
+    """Collect existing row keys (tuples of the key_cols values) for skip-existing checks.
+    Equal values are deduplicated to one str object (file names and param values repeat across many rows)."""
     if not csv_path.exists():
         return None
-    keys = set()
-    with csv_path.open() as f:
+    # itemgetter(*cols) returns a tuple for 2+ columns; wrap the single-column case to match
+    if len(key_cols) == 1:
+        col = key_cols[0]
+        get_cols: Callable[[List[str]], RowKey] = lambda row: (row[col],)
+    elif key_cols:
+        get_cols = operator.itemgetter(*key_cols)
+    else:
+        get_cols = lambda row: ()
+    # run-local memo rather than sys.intern: the strings are released with the set
+    memo: Dict[str, str] = {}
+    dedup = memo.setdefault
+    with csv_path.open(newline="", buffering=1 << 20) as f:
         reader = csv.reader(f)
         next(reader, None)
-        for row in reader:
-            if not row: continue
-            key = ",".join(row[i] for i in key_cols)
-            keys.add(key)
-    return keys
-
-
-def parse_summary_lines(lines: Iterable[str]) -> Dict[str, str]:
-    # Parse lines into dicts of key=value; return the last one containing required keys
-    last_map: Dict[str, str] = {}
-    for ln in lines:
-        pairs = re.findall(r"(\w+)=([^\s]+)", ln)
-        if not pairs:
+        return frozenset(tuple(map(dedup, t, t)) for t in map(get_cols, filter(None, reader)))
+
+
+_KV_RE = re.compile(r"(\w+)=(\S+)")
+
+
+def _last_summary(lines_reversed: Iterable[str], required: Optional[Sequence[str]]) -> Optional[Dict[str, str]]:
+    # first line (of lines given last-to-first) with any key=value pair, or with all `required` keys
+    for ln in lines_reversed:
+        # cheap substring test first; most progress/log lines carry no key=value pair
+        if "=" not in ln or _KV_RE.search(ln) is None:
             continue
-        m = {k: v for (k, v) in pairs}
-        last_map = m
-    return last_map
+        m = {mo.group(1): mo.group(2) for mo in _KV_RE.finditer(ln)}
+        if required is None or all(k in m for k in required):
+            return m
+    return None
+
 
+def parse_summary_lines(lines: Sequence[str], required: Optional[Sequence[str]] = None) -> Dict[str, str]:
+    """Parse key=value pairs from the last line that has any (or, with `required`, all required keys).
+    Scans from the end since the summary line is normally the last output line."""
+    return _last_summary(reversed(lines), required) or {}
+
+
+def _iter_file_lines_reversed(path: Path, start: int = 0, block: int = 1 << 17) -> Iterator[str]:
+    """Yield the decoded lines of path[start:] from last to first, reading fixed-size blocks backwards."""
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        carry = b""
+        while pos > start:
+            n = min(block, pos - start)
+            pos -= n
+            f.seek(pos)
+            parts = (f.read(n) + carry).split(b"\n")
+            # the first piece may continue in the previous block
+            carry = parts[0]
+            for ln in reversed(parts[1:]):
+                yield ln.decode("utf-8", errors="replace").rstrip("\r")
+        if carry:
+            yield carry.decode("utf-8", errors="replace").rstrip("\r")
+
+
+def scan_log_for_summary(log_path: Path, required: Sequence[str], start: int = 0) -> Optional[Dict[str, str]]:
+    """Find the last line holding all required keys anywhere in log_path[start:], reading backwards
+    and stopping at the first hit. Fallback for runs whose summary is older than the output tail."""
+    try:
+        return _last_summary(_iter_file_lines_reversed(log_path, start), required)
+    except OSError:
+        return None
 
-def csv_append(csv_path: Path, header: Sequence[str], row: Sequence[str]) -> None:
-    new_file = not csv_path.exists()
-    with csv_path.open("a", newline="") as f:
-        w = csv.writer(f)
-        if new_file:
-            w.writerow(header)
+
+class CsvAppender:
+    """Keeps one buffered append handle (and csv.writer) per CSV path for the duration of a run.
+    Writes the header for new/empty files. Rows are flushed every `flush_rows` rows or after
+    `flush_interval` seconds, whichever comes first, and on close()."""
+
+    def __init__(self, flush_rows: int = 64, flush_interval: float = 2.0) -> None:
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self._open: Dict[Path, Tuple[TextIO, Any]] = {}
+        self._unflushed: Dict[Path, int] = {}
+        self._last_flush: Dict[Path, float] = {}
+
+    def open(self, csv_path: Path, header: Sequence[str]) -> Tuple[TextIO, Any]:
+        """Open (or create) csv_path for appending unless already open; a new or empty file gets the header
+        (flushed right away so readers see it). One open per path per run, no separate exists()/stat()."""
+        ent = self._open.get(csv_path)
+        if ent is None:
+            fh = csv_path.open("a", newline="", buffering=1 << 16)
+            w = csv.writer(fh, quoting=csv.QUOTE_MINIMAL)
+            # append mode starts at end of file, so position 0 means new or empty
+            if fh.tell() == 0:
+                w.writerow(header)
+                fh.flush()
+            ent = self._open[csv_path] = (fh, w)
+            self._unflushed[csv_path] = 0
+            self._last_flush[csv_path] = time.monotonic()
+        return ent
+
+    def append(self, csv_path: Path, header: Sequence[str], row: Sequence[str]) -> None:
+        fh, w = self.open(csv_path, header)
         w.writerow(row)
+        self._unflushed[csv_path] += 1
+        now = time.monotonic()
+        if self._unflushed[csv_path] >= self.flush_rows or now - self._last_flush[csv_path] >= self.flush_interval:
+            fh.flush()
+            self._unflushed[csv_path] = 0
+            self._last_flush[csv_path] = now
+
+    def close(self) -> None:
+        for fh, _w in self._open.values():
+            try:
+                fh.close()
+            except Exception:
+                pass
+        self._open.clear()
+        self._unflushed.clear()
+        self._last_flush.clear()
 
 
 def os_is_darwin() -> bool:
     return platform.system() == "Darwin"
 
 
+# -------------- Decompression helpers --------------
+
+SHM_DIR = Path("/dev/shm")
+
+
+def _xz_dc_cmd(infile: Path) -> List[str]:
+    """xz command that decompresses infile to stdout.
+    -T 0 enables xz's multi-threaded block decoder (ignored by xz < 5.4)."""
+    return [XZ_PATH, "-T", "0", "-dc", "--", str(infile)]
+
+
+def _cache_dir_for(out_dir: Path) -> Path:
+    """Directory for temp decompressed caches: $BENCH_TMPDIR if set, else tmpfs (/dev/shm) so reruns read
+    from RAM and results/log I/O doesn't compete with it; falls back to out_dir."""
+    for cand in (os.environ.get("BENCH_TMPDIR"), SHM_DIR):
+        if cand and os.path.isdir(cand) and os.access(cand, os.W_OK):
+            return Path(cand)
+    return out_dir
+
+
+# Copy chunk for in-process .xz decompression (fallback when no xz binary is available)
+DECOMPRESS_CHUNK_BYTES = 1 << 20
+
+
+@functools.lru_cache(maxsize=4)
+def _xz_binary_available(xz_path: str) -> bool:
+    return shutil.which(xz_path) is not None
+
+
+def _decompress_to_cache(fpath: Path, cache_dir: Path, verbose: bool) -> Optional[Path]:
+    """Decompress an .xz file once into a temp .cnf under cache_dir. Returns None on failure.
+    Runs _xz_dc_cmd (XZ_PATH, multi-threaded for multi-block inputs) when the binary is found,
+    else the stdlib lzma module in-process."""
+    with tempfile.NamedTemporaryFile(prefix="cached_", suffix=".cnf", delete=False, dir=str(cache_dir)) as tf:
+        cached_path = Path(tf.name)
+    try:
+        with open(cached_path, "wb") as out:
+            if _xz_binary_available(XZ_PATH):
+                subprocess.run(_xz_dc_cmd(fpath), check=True, stdout=out)
+            else:
+                with lzma.open(fpath, "rb") as src:
+                    shutil.copyfileobj(src, out, DECOMPRESS_CHUNK_BYTES)
+        vprint(verbose, f"Decompressed once: {fpath} -> {cached_path}")
+        return cached_path
+    except (subprocess.CalledProcessError, lzma.LZMAError, EOFError, OSError):
+        print(f"Failed to decompress {fpath} to {cached_path}", file=sys.stderr)
+        _unlink_quiet(cached_path)
+        return None
+    except BaseException:
+        _unlink_quiet(cached_path)
+        raise
+
+
+XZ_CACHE_DIRNAME = ".xzcache"
+_CACHE_ENTRY_RE = re.compile(r"[0-9a-f]{40}\.cnf")
+
+
+def _persistent_cache_key(fpath: Path) -> str:
+    """Stable key for a source .xz: resolved path, mtime and size (any edit yields a new key)."""
+    st = fpath.stat()
+    ident = f"{fpath.resolve()}\0{st.st_mtime_ns}\0{st.st_size}"
+    return hashlib.sha1(ident.encode("utf-8")).hexdigest()
+
+
+def _decompress_to_persistent_cache(fpath: Path, cache_dir: Path, verbose: bool) -> Optional[Path]:
+    """Return cache_dir/<key>.cnf, decompressing fpath only if no entry exists yet.
+    Entries survive across invocations; reuse bumps mtime so eviction drops least-recently-used first."""
+    target = cache_dir / f"{_persistent_cache_key(fpath)}.cnf"
+    if target.is_file():
+        try:
+            os.utime(target)
+        except OSError:
+            pass
+        vprint(verbose, f"Reusing cached decompression: {fpath} -> {target}")
+        return target
+    tmp = _decompress_to_cache(fpath, cache_dir, verbose)
+    if tmp is None:
+        return None
+    # atomic publish so concurrent/aborted runs never see a partial entry
+    os.replace(tmp, target)
+    return target
+
+
+def _evict_persistent_cache(cache_dir: Path, max_bytes: int, verbose: bool) -> None:
+    """Delete least-recently-used cache entries until their total size is <= max_bytes."""
+    entries: List[Tuple[float, int, Path]] = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if _CACHE_ENTRY_RE.fullmatch(entry.name) and entry.is_file():
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, Path(entry.path)))
+    except OSError:
+        return
+    total = sum(size for _mtime, size, _p in entries)
+    for _mtime, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        vprint(verbose, f"Evicting cached decompression: {path}")
+        _unlink_quiet(path)
+        total -= size
+
+
+def _unlink_quiet(path: Path) -> None:
+    try:
+        path.unlink()
+    except Exception:
+        pass
+
+
 # -------------- Execution helpers --------------
 
-def run_with_streaming(cmd: Sequence[str], infile: Path, log_path: Path, verbose: bool,
-                       memlimit_mb: Optional[int] = None,
-                       log_header: Optional[str] = None) -> Tuple[int, List[str]]:
-    """Run `cmd` with stdin as xz -dc of infile (if .xz) or direct file via -i path,
-    capturing stdout to log and memory-limiting on Linux. Return (exit_code, output_lines)."""
-    ensure_out_dir(log_path.parent)
+# Kernel pipe capacity for xz -> child streaming and Python read buffer for child stdout
+PIPE_BUF_BYTES = 1 << 20
+# Only this much trailing child output is decoded and parsed for the summary line
+OUTPUT_TAIL_BYTES = 1 << 17
+
+
+def _open_large_pipe() -> Tuple[int, int]:
+    """Return (read_fd, write_fd) of an OS pipe. On Linux the pipe capacity is raised to
+    PIPE_BUF_BYTES (F_SETPIPE_SZ) so xz and the consumer exchange data in fewer, larger syscalls."""
+    r, w = os.pipe()
+    if sys.platform.startswith("linux"):
+        try:
+            import fcntl
+            # F_SETPIPE_SZ is exposed by fcntl since Python 3.10; 1031 is the Linux constant
+            fcntl.fcntl(w, getattr(fcntl, "F_SETPIPE_SZ", 1031), PIPE_BUF_BYTES)
+        except OSError:
+            # may exceed /proc/sys/fs/pipe-max-size for unprivileged users; keep the default size
+            pass
+    return r, w
+
 
-    # Prepare stdin source
-    xz_proc = None
-    stdin_src = None
+try:
+    import resource as _resource
+    _HAVE_PRLIMIT = hasattr(_resource, "prlimit")
+except ImportError:  # Windows
+    _resource = None  # type: ignore[assignment]
+    _HAVE_PRLIMIT = False
 
+
+def _prlimit_as(pid: int, memlimit_mb: int) -> None:
+    """Cap RLIMIT_AS (bytes) of a running child process (Linux >= 2.6.36)."""
+    b = memlimit_mb * 1024 * 1024
+    try:
+        _resource.prlimit(pid, _resource.RLIMIT_AS, (b, b))  # type: ignore[union-attr]
+    except ProcessLookupError:
+        pass  # child already exited
+    except Exception as e:
+        print(f"[warn] Failed to set memlimit: {e}", file=sys.stderr)
+
+
+def _spawn_with_input(cmd: Sequence[str], infile: Path, verbose: bool, memlimit_mb: Optional[int],
+                      **popen_kwargs: Any) -> Tuple[subprocess.Popen, Optional[subprocess.Popen]]:
+    """Start `cmd` with stdin fed by xz -dc of infile (if .xz; otherwise cmd reads the path via -i),
+    applying the memlimit on Linux. popen_kwargs (stdout routing, text, ...) go to the consumer Popen.
+    Returns (proc, xz_proc)."""
     def set_memlimit():
         if memlimit_mb is None:
             return
@@ -256,62 +552,178 @@ def run_with_streaming(cmd: Sequence[str], infile: Path, log_path: Path, verbose
             except Exception as e:
                 print(f"[warn] Failed to set memlimit: {e}", file=sys.stderr)
 
-    try:
-        if infile.suffix == ".xz":
-            # stream via xz -dc, using XZ_PATH
-            xz_cmd = [XZ_PATH, "-dc", "--", str(infile)]
-            if verbose:
-                vprint(True, "PIPE:", " ".join(shlex.quote(x) for x in xz_cmd), "|", " ".join(shlex.quote(x) for x in cmd))
-            xz_proc = subprocess.Popen(xz_cmd, stdout=subprocess.PIPE)
-            stdin_src = xz_proc.stdout
-            # cmd expects -i - already present in cmd list
-            if sys.platform == "win32":
-                proc = subprocess.Popen(cmd, stdin=stdin_src, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-            else:
-                proc = subprocess.Popen(cmd, stdin=stdin_src, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, preexec_fn=set_memlimit if not os_is_darwin() else None)
-        else:
-            if verbose:
-                vprint(True, "RUN:", " ".join(shlex.quote(x) for x in cmd))
-            if sys.platform == "win32":
-                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-            else:
-                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, preexec_fn=set_memlimit if not os_is_darwin() else None)
-
-        lines: List[str] = []
-        with log_path.open("w") as logf:
-            if log_header:
-                logf.write(log_header)
-                if not log_header.endswith("\n"):
-                    logf.write("\n")
-                logf.flush()
-            assert proc.stdout is not None
-            for ln in proc.stdout:
-                logf.write(ln)
-                logf.flush()
-                lines.append(ln.rstrip("\n"))
-                if verbose:
-                    # emulate tee to console under -v
-                    sys.stderr.write(ln)
-        rc = proc.wait()
-        if xz_proc is not None:
+    # Linux: apply the limit from the parent with prlimit(2) right after spawning. Avoiding preexec_fn
+    # keeps CPython on its fast vfork/posix_spawn path. Other POSIX systems fall back to preexec_fn.
+    # The limit covers the spawned process itself; anything it forks before prlimit lands (e.g. a shell
+    # wrapper's child) is not limited, so cmd_template should exec the binary directly.
+    use_prlimit = memlimit_mb is not None and _HAVE_PRLIMIT
+    if sys.platform != "win32" and not os_is_darwin() and memlimit_mb is not None and not use_prlimit:
+        popen_kwargs["preexec_fn"] = set_memlimit
+
+    def start(argv: Sequence[str], **kw: Any) -> subprocess.Popen:
+        proc = subprocess.Popen(argv, **kw)
+        if use_prlimit:
+            _prlimit_as(proc.pid, memlimit_mb)  # type: ignore[arg-type]
+        return proc
+    if infile.suffix == ".xz":
+        # stream via xz -dc, using XZ_PATH
+        xz_cmd = _xz_dc_cmd(infile)
+        if verbose:
+            vprint(True, "PIPE:", " ".join(shlex.quote(x) for x in xz_cmd), "|", " ".join(shlex.quote(x) for x in cmd))
+        # xz writes straight into an enlarged OS pipe that the child reads as stdin
+        pipe_r, pipe_w = _open_large_pipe()
+        try:
             try:
-                xz_proc.terminate()
-            except Exception:
-                pass
-        return rc, lines
-    finally:
-        if xz_proc is not None and xz_proc.stdout is not None:
+                xz_proc = subprocess.Popen(xz_cmd, stdout=pipe_w)
+            finally:
+                os.close(pipe_w)
+            # cmd expects -i - already present in cmd list
+            proc = start(cmd, stdin=pipe_r, **popen_kwargs)
+        finally:
+            # the child holds its own copy; dropping ours lets xz see EPIPE once the child exits
+            os.close(pipe_r)
+        return proc, xz_proc
+    if verbose:
+        vprint(True, "RUN:", " ".join(shlex.quote(x) for x in cmd))
+    return start(cmd, **popen_kwargs), None
+
+
+def evict_page_cache(path: Path) -> bool:
+    """Ask the OS to drop cached pages of `path` so the next read is cold (no sudo needed on Linux).
+    macOS falls back to `purge` (whole buffer cache). Returns False when unsupported or failed."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            fd = os.open(path, os.O_RDONLY)
             try:
-                xz_proc.stdout.close()
-            except Exception:
-                pass
+                # dirty pages (e.g. a freshly written cache file) are not dropped by DONTNEED
+                os.fdatasync(fd)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+            return True
+        except OSError:
+            return False
+    if os_is_darwin():
+        try:
+            r = subprocess.run(["purge"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+            return r.returncode == 0
+        except OSError:
+            return False
+    return False
+
+
+def _stop_xz(xz_proc: Optional[subprocess.Popen], timeout: float = 1.0) -> None:
+    """Reap the xz feeder after the consumer exited. Our pipe end is already closed, so xz gets
+    EPIPE/SIGPIPE (or has finished) and exits on its own; kill only if it lingers past `timeout`."""
+    if xz_proc is None:
+        return
+    try:
+        xz_proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        xz_proc.kill()
+        xz_proc.wait()
+
+
+def _tail_lines(tail: bytes, truncated: bool) -> List[str]:
+    """Decode a byte tail of child output into lines; drop the first line if it was cut by truncation."""
+    lines = tail.decode("utf-8", errors="replace").splitlines()
+    return lines[1:] if truncated and lines else lines
+
+
+def run_with_streaming(cmd: Sequence[str], infile: Path, log_path: Path, verbose: bool,
+                       memlimit_mb: Optional[int] = None,
+                       log_header: Optional[str] = None) -> Tuple[int, List[str]]:
+    """Run `cmd` with stdin as xz -dc of infile (if .xz) or direct file via -i path,
+    capturing stdout to log and memory-limiting on Linux. Return (exit_code, output_lines).
+    Only verbose runs stream through Python (to tee to stderr); otherwise the log fd is handed to the child.
+    output_lines covers only the last OUTPUT_TAIL_BYTES of output (summaries are printed at the end)."""
+    ensure_out_dir(log_path.parent)
+    header_bytes = b""
+    if log_header:
+        header_bytes = log_header.encode("utf-8") + (b"" if log_header.endswith("\n") else b"\n")
+
+    if not verbose:
+        # No tee needed: the child writes straight into the log file (no per-line work in Python);
+        # the output tail is read back once it has exited.
+        with log_path.open("wb") as logb:
+            logb.write(header_bytes)
+            logb.flush()
+            out_start = logb.tell()
+            proc, xz_proc = _spawn_with_input(cmd, infile, verbose, memlimit_mb, stdout=logb, stderr=subprocess.STDOUT)
+            rc = proc.wait()
+        _stop_xz(xz_proc)
+        with log_path.open("rb") as logb:
+            size = logb.seek(0, os.SEEK_END)
+            tail_start = max(out_start, size - OUTPUT_TAIL_BYTES)
+            logb.seek(tail_start)
+            return rc, _tail_lines(logb.read(), tail_start > out_start)
+
+    proc, xz_proc = _spawn_with_input(cmd, infile, verbose, memlimit_mb,
+                                      stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=PIPE_BUF_BYTES)
+    # emulate tee to console under -v; raw bytes go to the underlying stderr buffer when there is one
+    err_buf = getattr(sys.stderr, "buffer", None)
+    # keep just enough recent chunks to cover OUTPUT_TAIL_BYTES (no per-chunk copying of the tail)
+    tail_chunks: Deque[bytes] = deque()
+    tail_len = 0
+    truncated = False
+    with log_path.open("wb", buffering=PIPE_BUF_BYTES) as logb:
+        logb.write(header_bytes)
+        assert proc.stdout is not None
+        while True:
+            # read1 returns whatever is available, so the tee stays live for slow producers
+            chunk = proc.stdout.read1(1 << 16)
+            if not chunk:
+                break
+            logb.write(chunk)
+            logb.flush()
+            if err_buf is not None:
+                sys.stderr.flush()
+                err_buf.write(chunk)
+                err_buf.flush()
+            else:
+                sys.stderr.write(chunk.decode("utf-8", errors="replace"))
+            tail_chunks.append(chunk)
+            tail_len += len(chunk)
+            while tail_len - len(tail_chunks[0]) >= OUTPUT_TAIL_BYTES:
+                tail_len -= len(tail_chunks.popleft())
+                truncated = True
+    rc = proc.wait()
+    _stop_xz(xz_proc)
+    tail = b"".join(tail_chunks)
+    if len(tail) > OUTPUT_TAIL_BYTES:
+        tail = tail[-OUTPUT_TAIL_BYTES:]
+        truncated = True
+    return rc, _tail_lines(tail, truncated)
+
+
+def run_discard_output(cmd: Sequence[str], infile: Path, verbose: bool, memlimit_mb: Optional[int] = None) -> int:
+    """Run `cmd` like run_with_streaming (same input and memlimit handling) but discard its output."""
+    proc, xz_proc = _spawn_with_input(cmd, infile, verbose, memlimit_mb,
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    rc = proc.wait()
+    _stop_xz(xz_proc)
+    return rc
+
+
+def run_warmups(cmd: Sequence[str], infile: Path, verbose: bool, memlimit_mb: Optional[int],
+                runs: int, seconds: float) -> None:
+    """Unrecorded executions before a measured run: at least `runs` times, and keep going
+    until `seconds` of wall time have elapsed (when > 0). Stops early if a warmup run fails."""
+    t0 = time.monotonic()
+    done = 0
+    while done < runs or (seconds > 0 and time.monotonic() - t0 < seconds):
+        rc = run_discard_output(cmd, infile, False, memlimit_mb=memlimit_mb)
+        done += 1
+        if rc != 0:
+            vprint(True, f"[warn] Warmup run exited with {rc}; skipping remaining warmups")
+            return
+    vprint(verbose, f"Warmup: {done} run(s) in {time.monotonic() - t0:.2f}s")
 
 
 # -------------- Generic config runner helpers --------------
 
 def _load_config(path: Path) -> Dict[str, Any]:
     try:
-        import json
         if path.suffix.lower() in (".yaml", ".yml"):
             try:
                 import yaml  # type: ignore
@@ -334,18 +746,33 @@ def _discover_bin_generic(target_name: str, roots: Sequence[Path]) -> Optional[P
     for root in roots:
         if not root.exists():
             continue
-        for dirpath, _dirs, files in os.walk(root):
-            if target_name in files:
-                cand = Path(dirpath) / target_name
-                if cand.is_file() and os.access(cand, os.X_OK):
-                    return cand
+        # Top-down walk in os.walk order: a directory's own entries are checked before its subdirectories
+        stack = [str(root)]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            subdirs: List[str] = []
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name == target_name and entry.is_file() and os.access(entry.path, os.X_OK):
+                            return Path(entry.path)
+                    except OSError:
+                        continue
+            stack.extend(reversed(subdirs))
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def _discover_bin_by_name(name: str) -> Optional[Path]:
     """Discover a binary by algorithm name without hardcoded paths.
     - Prefer registry-provided discover entries if available.
     - Fallback: recursively search under build/ for an executable named <name>.
+    Results are memoized per process (the build/ walk is the expensive part).
     """
     # Try algorithms registry
     try:
@@ -464,53 +891,52 @@ def _product_sweep(param_specs: List[Dict[str, Any]], base_params: Params) -> Li
     return combos
 
 
+_PLACEHOLDER_RE = re.compile(r"\$\{(\w+)\}")
+
+
 def _format_cmd(cmd_template: Sequence[str], params: Params, infile: Path, bin_path: Optional[Path] = None) -> List[str]:
     # Replace ${key} occurrences with params[key]; special token ${input} becomes '-' or file path
     # If template references ${bin}, ensure it's resolved
     p = dict(params)
-    if any("${bin}" in t for t in cmd_template):
+    uses_bin = any("${bin}" in t for t in cmd_template)
+    if uses_bin:
         # Auto-fill when missing or explicit auto
         if ("bin" not in p) or (str(p.get("bin")) in ("${auto}", "auto")):
             if bin_path is None:
                 raise ConfigError("cmd_template uses ${bin} but no binary path was provided or discovered")
             p["bin"] = str(bin_path)
-    tokens = [tok.replace("${input}", "-" if infile.suffix == ".xz" else str(infile)) for tok in cmd_template]
-    for k, v in p.items():
-        tokens = [t.replace(f"${{{k}}}", str(v)) for t in tokens]
-    # Drop unresolved placeholder pairs like ['-t','${threads}'] or ['--maxbuf','${maxbuf}']
+    subst: Dict[str, str] = {k: str(v) for k, v in p.items()}
+    subst["input"] = "-" if infile.suffix == ".xz" else str(infile)
+    # One regex pass per token; unknown placeholders are left in place
+    tokens = [_PLACEHOLDER_RE.sub(lambda mo: subst.get(mo.group(1), mo.group(0)), str(tok)) for tok in cmd_template]
+    # A token that is still exactly one placeholder is unresolved
+    unresolved = [_PLACEHOLDER_RE.fullmatch(t) is not None for t in tokens]
+    # Drop unresolved placeholder pairs like ['-t','${threads}'] or ['--maxbuf','${maxbuf}'],
+    # standalone unresolved placeholders, and empty tokens (optional flags that expand to "")
     cleaned: List[str] = []
     i = 0
     while i < len(tokens):
         t = tokens[i]
-        if i + 1 < len(tokens) and tokens[i+1].startswith("${") and tokens[i+1].endswith("}") and t.startswith("-"):
+        if unresolved[i]:
+            i += 1
+            continue
+        if i + 1 < len(tokens) and unresolved[i + 1] and t.startswith("-"):
             # skip both flag and unresolved value
             i += 2
             continue
-        # also skip any standalone unresolved placeholders
-        if t.startswith("${") and t.endswith("}"):
-            i += 1
-            continue
-        cleaned.append(t)
+        if t != "":
+            cleaned.append(t)
         i += 1
-    tokens = cleaned
-    # Remove any empty tokens (useful for optional flags that may expand to "")
-    tokens = [t for t in tokens if t != ""]
     # If template already included ${bin}, it's now resolved in tokens. Otherwise prepend bin_path if provided.
-    if any(t == "${bin}" for t in tokens):
-        # unresolved bin is an error
-        raise ConfigError("Unresolved ${bin} in cmd_template")
-    if any("${bin}" in t for t in cmd_template):
-        return tokens
+    if uses_bin:
+        return cleaned
     if bin_path is not None:
-        return [str(bin_path)] + tokens
-    return tokens
+        return [str(bin_path)] + cleaned
+    return cleaned
 
 
 def _subst_template(tmpl: str, vars_map: Mapping[str, str]) -> str:
-    s = str(tmpl)
-    for k, v in vars_map.items():
-        s = s.replace(f"${{{k}}}", str(v))
-    return s
+    return _PLACEHOLDER_RE.sub(lambda mo: str(vars_map[mo.group(1)]) if mo.group(1) in vars_map else mo.group(0), str(tmpl))
 
 
 def _compute_auto_params(algo_cfg: Mapping[str, Any], combo: Params, out_dir: Path, algo_name: str, file_path: Optional[Path]) -> Dict[str, str]:
@@ -567,13 +993,17 @@ def _compute_auto_params(algo_cfg: Mapping[str, Any], combo: Params, out_dir: Pa
     return res
 
 
+_SLUG_RE = re.compile(r"[^A-Za-z0-9._+-]")
+
+
+@functools.lru_cache(maxsize=4096)
 def _slug_value(val: str, max_len: int = 80) -> str:
     """Make a value safe for filenames: replace path separators and other unsafe chars.
-    Also clamp length to avoid overlong filenames.
+    Also clamp length to avoid overlong filenames. Memoized: sweeps repeat the same values.
     """
     s = str(val)
     # Replace any non-alnum and not in a small safe set with '_'
-    s = re.sub(r"[^A-Za-z0-9._+-]", "_", s)
+    s = _SLUG_RE.sub("_", s)
     if len(s) > max_len:
         s = s[:max_len]
     return s
@@ -595,19 +1025,66 @@ def _params_tag(params: Params, exclude_keys: Optional[Sequence[str]] = None) ->
 
 def _short_hash_tag(params: Params, extra: Optional[Mapping[str, str]] = None, length: int = 12) -> str:
     """Build a short, stable hash tag from params and optional extras.
-    Uses SHA1 over a JSON dump with sorted keys, then returns first `length` hex chars.
+    Uses BLAKE2b over the NUL-joined sorted key=value pairs, returning `length` hex chars (clamped to 8..40).
     """
     m: Dict[str, str] = dict(params)
     if extra:
         m.update({k: str(v) for k, v in extra.items()})
-    blob = json.dumps(m, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    h = hashlib.sha1(blob).hexdigest()
-    return h[:max(8, min(40, length))]
+    n = max(8, min(40, length))
+    blob = b"\0".join(f"{k}={v}".encode("utf-8") for k, v in sorted(m.items()))
+    return hashlib.blake2b(blob, digest_size=(n + 1) // 2).hexdigest()[:n]
+
+
+# One reusable encoder: json.dumps(..., sort_keys=True) builds a new JSONEncoder on every call
+_HEADER_ENCODER = json.JSONEncoder(sort_keys=True)
+
+
+def _compose_log_header(stamp: str, algo: str, display_base: str, use_path: Path, cmd: Sequence[str],
+                        params: Params, ml: Optional[int]) -> str:
+    """Descriptive JSON header written at the top of each run log."""
+    header_map = {
+        "timestamp": stamp,
+        "algo": algo,
+        "file": display_base,
+        "input_path": str(use_path),
+        "cmd": " ".join(shlex.quote(x) for x in cmd),
+        "params": params,
+        "memlimit_mb": None if ml is None else ml,
+    }
+    return "# bench_runner header\n" + _HEADER_ENCODER.encode(header_map) + "\n# ---- output ----\n"
+
+
+def _plan_runs(combos: Iterable[Params], ml_list: Sequence[Optional[int]],
+               compute_auto: Callable[[Params], Mapping[str, str]],
+               exists: Optional[Callable[[Mapping[str, str], Optional[int]], bool]],
+               exists_needs_auto: bool) -> Iterator[Tuple[Params, Optional[int]]]:
+    """Yield (combo merged with auto params, memlimit) for every run still to do.
+    `exists` is the skip-existing check (None disables it). It runs on the bare combo, before auto params
+    are computed, unless a key column is itself an auto param (exists_needs_auto)."""
+    for combo in combos:
+        ml_todo = ml_list
+        if exists is not None and not exists_needs_auto:
+            ml_todo = [ml for ml in ml_list if not exists(combo, ml)]
+            if not ml_todo:
+                continue
+        # auto-generated params are independent of memlimit
+        combo2 = {**combo, **compute_auto(combo)}
+        for ml in ml_todo:
+            if exists is not None and exists_needs_auto and exists(combo2, ml):
+                continue
+            yield combo2, ml
+
+
+def _log_name_parts() -> Tuple[str, str, Iterator[int]]:
+    """(timestamp, pid tag, run counter) for one invocation's log names. The timestamp is taken once;
+    pid tag + counter keep names unique within the invocation and across concurrent ones."""
+    return time.strftime("%Y%m%d-%H%M%S"), f"{os.getpid():x}", itertools.count()
 
 
 def _parse_required_keys(lines: Sequence[str], required: Sequence[str]) -> Optional[Dict[str, str]]:
-    m = parse_summary_lines(lines)
-    return m if all(k in m for k in required) else None
+    # parse_summary_lines already only returns a line holding every required key (or {})
+    m = parse_summary_lines(lines, required)
+    return m if m or not required else None
 
 
 def run_from_config(config_path: Path, verbose: bool = False) -> int:
@@ -658,6 +1135,85 @@ def run_from_config(config_path: Path, verbose: bool = False) -> int:
     if not isinstance(algos, list) or not algos:
         raise ConfigError("'algorithms' must be a non-empty list")
 
+    # Measurement mode: "hot" (default) reuses the OS page cache; "cold" evicts the input before each run
+    mode = str(cfg.get("mode", "hot")).lower()
+    if mode not in ("hot", "cold"):
+        raise ConfigError(f"mode must be 'hot' or 'cold', got: {mode}")
+    cold = mode == "cold"
+
+    # Decompression cache: temp files for this run (default) or a persistent store keyed by source identity
+    cache_spec = cfg.get("cache") or {}
+    if not isinstance(cache_spec, dict):
+        raise ConfigError("'cache' must be an object, e.g. {\"persistent\": true}")
+    persistent = bool(cache_spec.get("persistent", False))
+    max_bytes: Optional[int] = None
+    if cache_spec.get("max_bytes") is not None:
+        try:
+            max_bytes = int(cache_spec["max_bytes"])
+        except (TypeError, ValueError):
+            raise ConfigError("cache.max_bytes must be an integer byte count")
+        if max_bytes < 0:
+            raise ConfigError("cache.max_bytes must be >= 0")
+    decompress: Callable[[Path], Optional[Path]]
+    if persistent:
+        cache_dir = Path(cache_spec.get("dir") or (out_dir / XZ_CACHE_DIRNAME))
+        ensure_out_dir(cache_dir)
+        decompress = lambda f: _decompress_to_persistent_cache(f, cache_dir, verbose)
+    else:
+        # tmpfs pages cannot be evicted, so cold runs keep temp caches on disk
+        cache_dir = out_dir if cold else _cache_dir_for(out_dir)
+        decompress = lambda f: _decompress_to_cache(f, cache_dir, verbose)
+
+    # Decompressed .xz inputs, keyed by source path; reused by every algorithm in this config
+    xz_cache: Dict[Path, Optional[Path]] = {}
+
+    def _cleanup_xz_cache() -> None:
+        if not persistent:
+            for cp in xz_cache.values():
+                if cp is not None:
+                    _unlink_quiet(cp)
+        xz_cache.clear()
+
+    try:
+        jobs = _resolve_jobs(int(cfg.get("jobs", 1)), verbose)
+    except (TypeError, ValueError):
+        raise ConfigError("jobs must be an integer")
+
+    appender = CsvAppender()
+    atexit.register(_cleanup_xz_cache)
+    try:
+        if jobs > 1:
+            # imported lazily: pulls in multiprocessing, which serial runs and --help never need
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                return _run_config_algorithms(algos, registry, sel_files, out_dir, xz_cache, decompress, cold, verbose, appender, pool)
+        return _run_config_algorithms(algos, registry, sel_files, out_dir, xz_cache, decompress, cold, verbose, appender)
+    finally:
+        appender.close()
+        _cleanup_xz_cache()
+        atexit.unregister(_cleanup_xz_cache)
+        if persistent and max_bytes is not None:
+            _evict_persistent_cache(cache_dir, max_bytes, verbose)
+
+
+def _resolve_jobs(jobs: int, verbose: bool) -> int:
+    """Parallel runs: jobs > 1 enables a process pool (0 = one worker per CPU); -v keeps serial tee output."""
+    if jobs < 0:
+        raise ValueError("jobs must be >= 0")
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs > 1 and verbose:
+        vprint(True, f"jobs={jobs} ignored under --verbose; running serially")
+        jobs = 1
+    return jobs
+
+
+def _run_config_algorithms(algos: List[Dict[str, Any]], registry: Mapping[str, Any], sel_files: Sequence[Path],
+                           out_dir: Path, xz_cache: Dict[Path, Optional[Path]],
+                           decompress: Callable[[Path], Optional[Path]], cold: bool, verbose: bool,
+                           appender: CsvAppender, pool: Optional[Executor] = None) -> int:
+    warned_cold = False
+    stamp, run_tag, run_ids = _log_name_parts()
     for algo in algos:
         name = algo.get("name")
         if not name:
@@ -690,6 +1246,7 @@ def run_from_config(config_path: Path, verbose: bool = False) -> int:
         cmd_template = algo.get("cmd_template") or reg_algo.get("cmd_template")
         if not isinstance(cmd_template, list) or not cmd_template:
             raise ConfigError("cmd_template must be provided in config or registry")
+        cmd_template = [str(x) for x in cmd_template]
         csv_obj = (algo.get("csv") or {}) or (reg_algo.get("csv") or {})
         csv_name = csv_obj.get("path") or f"{name}_results.csv"
         csv_path = out_dir / csv_name
@@ -705,13 +1262,35 @@ def run_from_config(config_path: Path, verbose: bool = False) -> int:
             if not isinstance(key_cols, list):
                 raise ConfigError("csv.key_cols must be provided when skip_existing is true")
             keys = build_keys_set(csv_path, key_cols)
+            try:
+                key_col_names: List[str] = [header[i] for i in key_cols]
+            except (IndexError, TypeError):
+                raise ConfigError(f"csv.key_cols {key_cols} do not index csv.header for {name}")
         else:
             keys = None
+            key_col_names = []
+        # Existing runs can be skipped before computing auto params unless a key column is auto-generated
+        auto_names = {ap.get("name") for ap in (reg_algo.get("auto_params") or []) if isinstance(ap, dict)}
+        keys_need_auto = any(k in auto_names for k in key_col_names)
+        col_plan = _column_plan(header)
+        key_plan = _column_plan(key_col_names)
+        # Positions of param-derived key columns; "" there means the param is unresolved for this combo
+        # (file/memlimit_mb are filled by the runner, where "" is a real value, e.g. no memlimit)
+        param_key_pos = [j for j, (kind, _c) in enumerate(key_plan) if kind == COL_LOOKUP]
 
         # Per-file caching and memlimit
         cache = bool(algo.get("cache", True))
         memlimits = algo.get("memlimits", []) or []
 
+        # Optional unrecorded warmup executions before each measured run
+        try:
+            warmup_runs = int(algo.get("warmup_runs", 0) or 0)
+            warmup_seconds = float(algo.get("warmup_seconds", 0) or 0)
+        except (TypeError, ValueError):
+            raise ConfigError("warmup_runs must be an int and warmup_seconds a number")
+        if warmup_runs < 0 or warmup_seconds < 0:
+            raise ConfigError("warmup_runs and warmup_seconds must be >= 0")
+
         # Base params: registry defaults overridden by config
         base_params_src = {}
         base_params_src.update(reg_algo.get("base_params") or {})
@@ -729,7 +1308,7 @@ def run_from_config(config_path: Path, verbose: bool = False) -> int:
                 if not name_key:
                     continue
                 vals = overrides.get(name_key, p.get("default", []))
-                vals = _validate_and_normalize_param_values(name_key, [str(v) for v in vals], p, user_provided=True)
+                vals = _validate_and_normalize_param_values(name_key, vals, p, user_provided=True)
                 spec = {"name": name_key, "values": vals}
                 if p.get("when") is not None:
                     spec["when"] = p.get("when")
@@ -753,7 +1332,7 @@ def run_from_config(config_path: Path, verbose: bool = False) -> int:
                 name_key = p.get("map_to") or p.get("name")
                 if not name_key or name_key in mentioned:
                     continue
-                vals = _validate_and_normalize_param_values(name_key, [str(v) for v in p.get("default", [])], p, user_provided=False)
+                vals = _validate_and_normalize_param_values(name_key, p.get("default", []), p, user_provided=False)
                 spec = {"name": name_key, "values": vals}
                 if p.get("when") is not None:
                     spec["when"] = p.get("when")
@@ -764,7 +1343,7 @@ def run_from_config(config_path: Path, verbose: bool = False) -> int:
                 name_key = p.get("map_to") or p.get("name")
                 if not name_key:
                     continue
-                vals = _validate_and_normalize_param_values(name_key, [str(v) for v in p.get("default", [])], p, user_provided=False)
+                vals = _validate_and_normalize_param_values(name_key, p.get("default", []), p, user_provided=False)
                 spec = {"name": name_key, "values": vals}
                 if p.get("when") is not None:
                     spec["when"] = p.get("when")
@@ -776,122 +1355,145 @@ def run_from_config(config_path: Path, verbose: bool = False) -> int:
                 w = csv.writer(f)
                 w.writerow(header)
 
+        def _record(ctx: Tuple[str, Optional[int], Params, Path], result: Tuple[int, Optional[Dict[str, str]], bool]) -> None:
+            """Turn a finished run into a CSV row (post-run skip-existing check included); keep the log on failure."""
+            nonlocal warned_cold
+            display_base, ml, combo2, log = ctx
+            _rc, m, evicted = result
+            if not evicted and not warned_cold:
+                vprint(True, "[warn] mode=cold: could not evict page cache on this platform; runs may be warm")
+                warned_cold = True
+            ok = False
+            try:
+                if m is not None:
+                    row_vals = _build_row(col_plan, display_base, ml, m, combo2)
+                    if keys is not None:
+                        key_cols = csv_obj.get("key_cols")
+                        if key_cols is not None:
+                            key = tuple(row_vals[i] for i in key_cols)
+                            if key in keys:
+                                vprint(verbose, f"Skip existing: {','.join(key)}")
+                                ok = True
+                                return
+                    appender.append(csv_path, header, row_vals)
+                    ok = True
+            finally:
+                if ok:
+                    try:
+                        log.unlink()
+                    except Exception:
+                        pass
+                else:
+                    vprint(True, f"[warn] No summary parsed or run failed; kept log: {log}")
+
+        pending: List[Tuple[Future, Tuple[str, Optional[int], Params, Path]]] = []
+
         # Iterate files and runs for THIS algorithm
         for fpath in sel_files:
             display_base = fpath.name
-            combos = _product_sweep(param_specs, base_params)
 
-            # Optional caching for .xz per file
-            cached_path: Optional[Path] = None
-            if cache and (fpath.suffix == ".xz"):
-                with tempfile.NamedTemporaryFile(prefix="cached_", suffix=".cnf", delete=False, dir=str(out_dir)) as tf:
-                    cached_path = Path(tf.name)
-                try:
-                    with open(cached_path, "wb") as out:
-                        subprocess.run([XZ_PATH, "-dc", "--", str(fpath)], check=True, stdout=out)
-                    vprint(verbose, f"Decompressed once: {fpath} -> {cached_path}")
-                except subprocess.CalledProcessError:
-                    print(f"Failed to decompress {fpath} to {cached_path}", file=sys.stderr)
-                    cached_path = None
-
-            for combo in combos:
-                ml_list: List[Optional[int]] = memlimits if memlimits else [None]
-                for ml in ml_list:
-                    # compute auto-generated params and merge into a derived combo
-                    aut = _compute_auto_params(reg_algo, combo, out_dir, name, fpath)
-                    combo2 = {**combo, **aut}
-                    # Pre-check skip-existing if keys provided
-                    if keys is not None:
-                        key_cols = csv_obj.get("key_cols")
-                        pre_vals: List[str] = []
-                        unresolved = False
-                        for col in header:
-                            if col == "file":
-                                pre_vals.append(display_base)
-                            elif col == "memlimit_mb":
-                                pre_vals.append("" if ml is None else str(ml))
-                            else:
-                                pre_vals.append(combo2.get(col, ""))
-                        for idx in (key_cols or []):
-                            if pre_vals[idx] == "":
-                                unresolved = True
-                                break
-                        if not unresolved and key_cols is not None:
-                            pre_key = ",".join(pre_vals[i] for i in key_cols)
-                            if pre_key in keys:
-                                vprint(verbose, f"Skip existing: {pre_key}")
-                                continue
-
-                    use_path = cached_path if cached_path is not None else fpath
-                    cmd = _format_cmd([str(x) for x in cmd_template], combo2, use_path, bin_path=bin_path)
-                    stamp = time.strftime("%Y%m%d-%H%M%S")
-                    rand = f"{random.randrange(16**6):06x}"
-                    short = _short_hash_tag(combo2, {"file": display_base, "mem": "" if ml is None else str(ml)})
-                    ml_tag = f".m{ml}mb" if ml is not None else ""
-                    safe_base = _slug_value(display_base, max_len=80)
-                    log = out_dir / f"{safe_base}.{name}.{short}.{rand}{ml_tag}.{stamp}.log"
-
-                    # Compose a descriptive header inside the log
-                    header_map = {
-                        "timestamp": stamp,
-                        "algo": name,
-                        "file": display_base,
-                        "input_path": str(use_path),
-                        "cmd": " ".join(shlex.quote(x) for x in cmd),
-                        "params": combo2,
-                        "memlimit_mb": None if ml is None else ml,
-                    }
-                    log_header = "# bench_runner header\n" + json.dumps(header_map, sort_keys=True) + "\n# ---- output ----\n"
-
-                    rc, lines = run_with_streaming(cmd, use_path, log, verbose, memlimit_mb=ml, log_header=log_header)
-                    ok = False
-                    try:
-                        m = _parse_required_keys(lines, required_keys)
-                        if m is not None:
-                            row_vals: List[str] = []
-                            for col in header:
-                                if col == "file":
-                                    row_vals.append(display_base)
-                                elif col == "memlimit_mb":
-                                    row_vals.append("" if ml is None else str(ml))
-                                else:
-                                    row_vals.append(m.get(col, combo2.get(col, "")))
-                            if keys is not None:
-                                key_cols = csv_obj.get("key_cols")
-                                if key_cols is not None:
-                                    key = ",".join(row_vals[i] for i in key_cols)
-                                    if key in keys:
-                                        vprint(verbose, f"Skip existing: {key}")
-                                        ok = True
-                                        continue
-                            csv_append(csv_path, header, row_vals)
-                            ok = True
-                    finally:
-                        if ok:
-                            try:
-                                log.unlink()
-                            except Exception:
-                                pass
-                        else:
-                            vprint(True, f"[warn] No summary parsed or run failed; kept log: {log}")
-
-            if cached_path is not None:
-                try:
-                    cached_path.unlink()
-                except Exception:
-                    pass
+            def _exists(values: Mapping[str, str], ml: Optional[int]) -> bool:
+                """Pre-run skip-existing check; keys with an unresolved (empty) param column never match."""
+                assert keys is not None
+                pre_key = _row_key(key_plan, display_base, ml, values)
+                if any(pre_key[j] == "" for j in param_key_pos) or pre_key not in keys:
+                    return False
+                vprint(verbose, f"Skip existing: {','.join(pre_key)}")
+                return True
+
+            safe_base = _slug_value(display_base, max_len=80)
+            ml_list: List[Optional[int]] = memlimits if memlimits else [None]
+            plan = _plan_runs(_product_sweep(param_specs, base_params), ml_list,
+                              lambda combo: _compute_auto_params(reg_algo, combo, out_dir, name, fpath),
+                              _exists if keys is not None else None, keys_need_auto)
+            for combo2, ml in plan:
+                # Optional caching for .xz per file (shared across algorithms; created on first real run)
+                cached_path: Optional[Path] = None
+                if cache and (fpath.suffix == ".xz"):
+                    if fpath not in xz_cache:
+                        xz_cache[fpath] = decompress(fpath)
+                    cached_path = xz_cache[fpath]
+                use_path = cached_path if cached_path is not None else fpath
+                cmd = _format_cmd(cmd_template, combo2, use_path, bin_path=bin_path)
+                short = _short_hash_tag(combo2, {"file": display_base, "mem": "" if ml is None else str(ml)})
+                ml_tag = f".m{ml}mb" if ml is not None else ""
+                log = out_dir / f"{safe_base}.{name}.{short}.{run_tag}-{next(run_ids):04x}{ml_tag}.{stamp}.log"
+
+                # Compose a descriptive header inside the log
+                log_header = _compose_log_header(stamp, name, display_base, use_path, cmd, combo2, ml)
+
+                task: RunTask = {
+                    "cmd": cmd,
+                    "input": use_path,
+                    "log": log,
+                    "log_header": log_header,
+                    "memlimit_mb": ml,
+                    "required_keys": list(required_keys),
+                    "warmup_runs": warmup_runs,
+                    "warmup_seconds": warmup_seconds,
+                    "cold": cold,
+                    "verbose": verbose,
+                }
+                ctx = (display_base, ml, combo2, log)
+                if pool is None:
+                    _record(ctx, _run_one(task))
+                else:
+                    pending.append((pool.submit(_run_one, task), ctx))
+
+        # Drain this algorithm's parallel runs before moving on (CSV writes stay in this process)
+        for fut, ctx in pending:
+            _record(ctx, fut.result())
+        pending.clear()
 
     return 0
 
 
+def _run_one(task: RunTask) -> Tuple[int, Optional[Dict[str, str]], bool]:
+    """Execute one planned run: warmups, optional cold eviction, then the measured run; parse its summary.
+    Top-level so it can be shipped to a process pool. Returns (exit_code, summary_or_None, evicted)."""
+    cmd, use_path, ml, verbose = task["cmd"], task["input"], task["memlimit_mb"], task["verbose"]
+    if task["warmup_runs"] > 0 or task["warmup_seconds"] > 0:
+        run_warmups(cmd, use_path, verbose, ml, task["warmup_runs"], task["warmup_seconds"])
+    evicted = evict_page_cache(use_path) if task["cold"] else True
+    rc, lines = run_with_streaming(cmd, use_path, task["log"], verbose, memlimit_mb=ml, log_header=task["log_header"])
+    m = _parse_required_keys(lines, task["required_keys"])
+    if m is None and task["required_keys"]:
+        # the summary may precede more than OUTPUT_TAIL_BYTES of trailing output: search the whole log
+        # (header excluded), newest lines first, stopping as soon as a complete summary is found
+        out_start = len(task["log_header"].encode("utf-8")) if task["log_header"] else 0
+        try:
+            beyond_tail = task["log"].stat().st_size - out_start > OUTPUT_TAIL_BYTES
+        except OSError:
+            beyond_tail = False
+        if beyond_tail:
+            m = scan_log_for_summary(task["log"], task["required_keys"], out_start)
+    return rc, m, evicted
+
+
 # -------------- Dynamic algorithm registry mode --------------
 
+REGISTRY_PATH_DEFAULT = ROOT_DIR / "scripts/benchmarks/configs/algorithms.json"
+
+
+def _registry_cache_key(path: Optional[Path] = None) -> Tuple[Path, Optional[int]]:
+    """(resolved path, mtime_ns) so in-process caches are invalidated when the registry file is edited."""
+    registry_path = (path or REGISTRY_PATH_DEFAULT).resolve()
+    try:
+        return registry_path, registry_path.stat().st_mtime_ns
+    except OSError:
+        return registry_path, None
+
+
 def _load_algorithms_registry(path: Optional[Path] = None) -> Dict[str, AlgorithmRegistryEntry]:
-    registry_path = path or (ROOT_DIR / "scripts/benchmarks/configs/algorithms.json")
+    """Load the algorithms registry. Parsed once per (path, mtime) and process; callers must not mutate it."""
+    return _load_algorithms_registry_cached(*_registry_cache_key(path))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_algorithms_registry_cached(registry_path: Path, _mtime_ns: Optional[int] = None) -> Dict[str, AlgorithmRegistryEntry]:
     if not registry_path.exists():
         raise ConfigError(f"Algorithms registry not found: {registry_path}")
     try:
-        import json
         with registry_path.open() as f:
             data = json.load(f)
         algos = data.get("algorithms", [])
@@ -911,6 +1513,7 @@ def _add_core_common(sp: argparse.ArgumentParser) -> None:
     sp.add_argument("--from-csv", type=Path, dest="reuse_csv", default=None, help="CSV path; defaults to algo CSV when --reuse-files used")
     sp.add_argument("--skip-existing", action="store_true", help="Skip runs already present in CSV")
     sp.add_argument("--dry-run", action="store_true", help="Plan only; print intended commands")
+    sp.add_argument("-j", "--jobs", type=int, default=1, help="Concurrent runs (0 = one per CPU); each run's memlimit applies per process. Ignored with -v")
     sp.add_argument("-v","--verbose", action="store_true", help="Verbose output")
     sp.add_argument("--bench-dir", type=Path, default=BENCH_DIR_DEFAULT)
     sp.add_argument("--out-dir", type=Path, default=OUT_DIR_DEFAULT)
@@ -935,7 +1538,7 @@ def _coerce_numeric(val: str, kind: str) -> float:
     return float(val)
 
 
-def _validate_and_normalize_param_values(name: str, values: List[str], pdef: Mapping[str, Any], user_provided: bool) -> List[str]:
+def _validate_and_normalize_param_values(name: str, values: Sequence[Any], pdef: Mapping[str, Any], user_provided: bool) -> List[str]:
     """Apply normalization and constraints from pdef to the list of values.
     Supports:
       - pdef.normalize == 'tau' (keeps >=2 or 'inf')
@@ -953,7 +1556,8 @@ def _validate_and_normalize_param_values(name: str, values: List[str], pdef: Map
     enum = pdef.get('enum')
     if enum:
         allowed = [str(x) for x in enum]
-        bad = [v for v in raw_vals if v not in allowed]
+        allowed_set = frozenset(allowed)
+        bad = [v for v in raw_vals if v not in allowed_set]
         if bad:
             raise ConfigError(f"Invalid values for {name}: {','.join(bad)} (allowed: {','.join(allowed)})")
     # Numeric constraints (with optional allow_inf)
@@ -962,6 +1566,10 @@ def _validate_and_normalize_param_values(name: str, values: List[str], pdef: Map
     vmin = pdef.get('min', None)
     vmax = pdef.get('max', None)
     if numeric_kind or vmin is not None or vmax is not None:
+        # bounds are converted once, not per value
+        fmin = float(vmin) if vmin is not None else None
+        fmax = float(vmax) if vmax is not None else None
+        kind = numeric_kind or 'float'
         checked: List[str] = []
         for v in raw_vals:
             if allow_inf and v.lower() == 'inf':
@@ -969,12 +1577,12 @@ def _validate_and_normalize_param_values(name: str, values: List[str], pdef: Map
                 continue
             # Validate numeric
             try:
-                num = _coerce_numeric(v, numeric_kind or 'float')
+                num = _coerce_numeric(v, kind)
             except Exception:
                 raise ConfigError(f"Value for {name} must be {numeric_kind or 'numeric'}: {v}")
-            if vmin is not None and num < float(vmin):
+            if fmin is not None and num < fmin:
                 raise ConfigError(f"Value for {name} below minimum {vmin}: {v}")
-            if vmax is not None and num > float(vmax):
+            if fmax is not None and num > fmax:
                 raise ConfigError(f"Value for {name} above maximum {vmax}: {v}")
             # Round/normalize back to int if requested
             if numeric_kind == 'int':
@@ -1019,150 +1627,198 @@ def run_algorithm_from_registry(algo_name: str, ns: argparse.Namespace, algo_cfg
     required_keys: List[str] = csv_cfg.get("required_keys") or []
     if not header or not required_keys:
         raise ConfigError(f"Algorithm '{algo_name}' missing csv.header or csv.required_keys")
+    # Checked once here: both the skip-existing set and the per-run keys index rows with these
+    key_cols = csv_cfg.get("key_cols", [])
+    if not isinstance(key_cols, list) or not all(
+            isinstance(i, int) and not isinstance(i, bool) and 0 <= i < len(header) for i in key_cols):
+        raise ConfigError(f"csv.key_cols {key_cols} do not index csv.header for {algo_name}")
     csv_name = csv_cfg.get("path") or f"{algo_name}_results.csv"
     csv_path = ns.out_dir / csv_name
-    # Initialize header if missing
-    if not csv_path.exists():
-        with csv_path.open("w", newline="") as f:
-            w = csv.writer(f); w.writerow(header)
-    keys = build_keys_set(csv_path, csv_cfg.get("key_cols", [])) if ns.skip_existing else None
-
-    # Select files
-    reuse_csv = ns.reuse_csv if ns.reuse_files else None
-    sel_files = select_files(all_files, ns.num, reuse_csv, ns.bench_dir, ns.verbose)
-
-    # Build param specs from CLI args according to schema
-    base_params: Dict[str, str] = {k: str(v) for k, v in (algo_cfg.get("base_params") or {}).items()}
-    param_specs: List[dict] = []
-    params_schema: List[dict] = algo_cfg.get("params", [])
-    # Collect values from ns
-    for pdef in params_schema:
-        cli = pdef.get("cli")
-        name = pdef.get("name")
-        map_to_val = pdef.get("map_to")
-        map_to: Optional[str] = map_to_val if isinstance(map_to_val, str) else name
-        if not cli or not isinstance(name, str) or not isinstance(map_to, str):
-            raise ConfigError(f"Param definition requires 'name' and 'cli': {pdef}")
-        dest = _dest_from_cli(str(cli))
-        values = getattr(ns, dest, None)
-        if values is None:
-            # fall back to config default
-            values = pdef.get("default", [])
-        user_provided = getattr(ns, dest, None) is not None
-        norm_values = _validate_and_normalize_param_values(map_to, [str(v) for v in values], pdef, user_provided)
-        if not norm_values:
-            continue
-        spec = {"name": map_to, "values": norm_values}
-        if pdef.get("when") is not None:
-            spec["when"] = pdef.get("when")
-        param_specs.append(spec)
-
-    # Iterate selections
-    for fpath in sel_files:
-        display_base = fpath.name
-        # Optional per-file cache for .xz
-        cached_path: Optional[Path] = None
-        if ns.cache and (fpath.suffix == '.xz') and (not ns.dry_run):
-            with tempfile.NamedTemporaryFile(prefix='cached_', suffix='.cnf', delete=False, dir=str(ns.out_dir)) as tf:
-                cached_path = Path(tf.name)
-            try:
-                with open(cached_path, 'wb') as out:
-                    subprocess.run([XZ_PATH,"-dc","--",str(fpath)], check=True, stdout=out)
-                vprint(ns.verbose, f"Decompressed once: {fpath} -> {cached_path}")
-            except subprocess.CalledProcessError:
-                print(f"Failed to decompress {fpath} to {cached_path}", file=sys.stderr)
-                cached_path = None
-
-        combos = _product_sweep(param_specs, base_params)
-        for combo in combos:
-            memlist: List[Optional[int]] = ns.memlimits if ns.memlimits else [None]
-            for ml in memlist:
-                # compute auto-generated params for registry mode
-                aut = _compute_auto_params(algo_cfg, combo, ns.out_dir, algo_name, fpath)
-                combo2 = {**combo, **aut}
+    appender = CsvAppender()
+    try:
+        # Initialize header if missing; the handle stays open for the whole run
+        appender.open(csv_path, header)
+        keys = build_keys_set(csv_path, key_cols) if ns.skip_existing else None
+
+        # Select files
+        reuse_csv = ns.reuse_csv if ns.reuse_files else None
+        sel_files = select_files(all_files, ns.num, reuse_csv, ns.bench_dir, ns.verbose)
+
+        # Build param specs from CLI args according to schema
+        base_params: Dict[str, str] = {k: str(v) for k, v in (algo_cfg.get("base_params") or {}).items()}
+        param_specs: List[dict] = []
+        params_schema: List[dict] = algo_cfg.get("params", [])
+        # Collect values from ns
+        for pdef in params_schema:
+            cli = pdef.get("cli")
+            name = pdef.get("name")
+            map_to_val = pdef.get("map_to")
+            map_to: Optional[str] = map_to_val if isinstance(map_to_val, str) else name
+            if not cli or not isinstance(name, str) or not isinstance(map_to, str):
+                raise ConfigError(f"Param definition requires 'name' and 'cli': {pdef}")
+            raw = getattr(ns, _dest_from_cli(str(cli)), None)
+            user_provided = raw is not None
+            # fall back to config default; the validator stringifies values itself
+            values = raw if user_provided else pdef.get("default", [])
+            norm_values = _validate_and_normalize_param_values(map_to, values, pdef, user_provided)
+            if not norm_values:
+                continue
+            spec = {"name": map_to, "values": norm_values}
+            if pdef.get("when") is not None:
+                spec["when"] = pdef.get("when")
+            param_specs.append(spec)
+
+        jobs = 1 if ns.dry_run else _resolve_jobs(getattr(ns, "jobs", 1), ns.verbose)
+        args = (algo_name, ns, algo_cfg, bin_path, sel_files, param_specs, base_params,
+                header, required_keys, csv_path, keys, key_cols, appender)
+        if jobs > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                return _run_registry_files(*args, pool=pool, max_pending=2 * jobs)
+        return _run_registry_files(*args)
+    finally:
+        appender.close()
+
+
+def _run_registry_files(algo_name: str, ns: argparse.Namespace, algo_cfg: Mapping[str, Any], bin_path: Path,
+                        sel_files: Sequence[Path], param_specs: List[dict], base_params: Params,
+                        header: List[str], required_keys: List[str], csv_path: Path,
+                        keys: Optional[FrozenSet[RowKey]], key_cols: List[int], appender: CsvAppender,
+                        pool: Optional[Executor] = None, max_pending: int = 0) -> int:
+    """Run the sweep for every selected file. With a pool, runs (across files) execute concurrently;
+    at most max_pending are in flight, rows are written here as they finish, and a file's .xz cache is
+    removed once its last run completes. key_cols must already be valid indices into header."""
+    key_col_names = [header[i] for i in key_cols]
+    col_plan = _column_plan(header)
+    key_plan = _column_plan(key_col_names)
+    # "" in a param-derived key column means the param is unresolved for this combo (see config mode)
+    param_key_pos = [j for j, (kind, _c) in enumerate(key_plan) if kind == COL_LOOKUP]
+    auto_names = {ap.get("name") for ap in (algo_cfg.get("auto_params") or []) if isinstance(ap, dict)}
+    keys_need_auto = any(k in auto_names for k in key_col_names)
+    cmd_template: List[str] = [str(x) for x in (algo_cfg.get("cmd_template") or [])]
+    cache_dir = _cache_dir_for(ns.out_dir)
+    memlist: List[Optional[int]] = ns.memlimits if ns.memlimits else [None]
+    stamp, run_tag, run_ids = _log_name_parts()
+    required = list(required_keys)
+    # Per-file .xz caches and the number of their runs still in flight
+    caches: Dict[Path, Optional[Path]] = {}
+    in_flight: Dict[Path, int] = {}
+    pending: Deque[Tuple[Future, Tuple[str, Optional[int], Params, Path, Path]]] = deque()
+
+    def _release(fpath: Path) -> None:
+        if in_flight.get(fpath, 0) == 0:
+            in_flight.pop(fpath, None)
+            cached = caches.pop(fpath, None)
+            if cached is not None:
+                _unlink_quiet(cached)
+
+    def _cleanup_caches() -> None:
+        # Caches may live on tmpfs (RAM): never leave them behind on errors or interrupts
+        for cached in caches.values():
+            if cached is not None:
+                _unlink_quiet(cached)
+        caches.clear()
+
+    def _record(ctx: Tuple[str, Optional[int], Params, Path, Path], result: Tuple[int, Optional[Dict[str, str]], bool]) -> None:
+        display_base, ml, combo2, log, fpath = ctx
+        _rc, m, _evicted = result
+        ok = False
+        try:
+            if m is not None:
+                row_vals = _build_row(col_plan, display_base, ml, m, combo2)
+                # Post-run skip-existing (safety)
+                if keys is not None:
+                    key = tuple(row_vals[i] for i in key_cols)
+                    if key and key in keys:
+                        vprint(ns.verbose, f"Skip existing: {','.join(key)}")
+                        ok = True
+                        return
+                appender.append(csv_path, header, row_vals)
+                ok = True
+        finally:
+            if ok:
+                try: log.unlink()
+                except Exception: pass
+            else:
+                vprint(True, f"[warn] No summary parsed or run failed; kept log: {log}")
+            in_flight[fpath] -= 1
+
+    def _drain(limit: int) -> None:
+        # CSV writes stay in this process, in submission order
+        while len(pending) > limit:
+            fut, ctx = pending.popleft()
+            _record(ctx, fut.result())
+            _release(ctx[4])
+
+    atexit.register(_cleanup_caches)
+    try:
+        # Iterate selections
+        for fpath in sel_files:
+            display_base = fpath.name
+
+            def _exists(values: Mapping[str, str], ml: Optional[int]) -> bool:
+                assert keys is not None
+                pre_key = _row_key(key_plan, display_base, ml, values)
+                if any(pre_key[j] == "" for j in param_key_pos) or pre_key not in keys:
+                    return False
+                vprint(ns.verbose, f"Skip existing: {','.join(pre_key)}")
+                return True
+
+            # Optional per-file cache for .xz (created on the first run that is not skipped)
+            cached_path: Optional[Path] = None
+            decompressed = False
+            in_flight[fpath] = 0
+            safe_base = _slug_value(display_base, max_len=80)
+            plan = _plan_runs(_product_sweep(param_specs, base_params), memlist,
+                              lambda combo: _compute_auto_params(algo_cfg, combo, ns.out_dir, algo_name, fpath),
+                              _exists if keys is not None else None, keys_need_auto)
+            for combo2, ml in plan:
+                if ns.cache and fpath.suffix == '.xz' and not ns.dry_run and not decompressed:
+                    cached_path = caches[fpath] = _decompress_to_cache(fpath, cache_dir, ns.verbose)
+                    decompressed = True
                 use_path = cached_path if cached_path is not None else fpath
-                cmd_template: List[str] = [str(x) for x in (algo_cfg.get("cmd_template") or [])]
                 cmd = _format_cmd(cmd_template, combo2, use_path, bin_path=bin_path)
-                # Log path: include params
-                stamp = time.strftime("%Y%m%d-%H%M%S")
-                params_tag = _params_tag(combo2, exclude_keys=["comp_out_dir", "comp_base"]) 
-                ml_tag = f".mem{ml}mb" if ml is not None else ""
-                safe_base = _slug_value(display_base, max_len=80)
-                rand = f"{random.randrange(16**6):06x}"
-                short = _short_hash_tag(combo2, {"file": display_base, "mem": "" if ml is None else str(ml)})
-                log = ns.out_dir / f"{safe_base}.{algo_name}.{short}.{rand}{ml_tag}.{stamp}.log"
-
                 if ns.dry_run:
                     vprint(True, "RUN:", " ".join(shlex.quote(x) for x in cmd))
                     continue
 
-                # Pre-run skip-existing attempt
-                if keys is not None:
-                    key_cols = csv_cfg.get("key_cols", [])
-                    pre_vals: List[str] = []
-                    for col in header:
-                        if col == "file":
-                            pre_vals.append(display_base)
-                        elif col == "memlimit_mb":
-                            pre_vals.append("" if ml is None else str(ml))
-                        else:
-                            pre_vals.append(combo2.get(col, ""))
-                    try:
-                        if all(isinstance(i, int) and pre_vals[i] != "" for i in key_cols):
-                            pre_key = ",".join(pre_vals[i] for i in key_cols if isinstance(i, int))
-                            if pre_key in keys:
-                                vprint(ns.verbose, f"Skip existing: {pre_key}")
-                                continue
-                    except Exception:
-                        pass
-
-                header_map = {
-                    "timestamp": stamp,
-                    "algo": algo_name,
-                    "file": display_base,
-                    "input_path": str(use_path),
-                    "cmd": " ".join(shlex.quote(x) for x in cmd),
-                    "params": combo2,
-                    "memlimit_mb": None if ml is None else ml,
+                # Log path: include params (only named for runs that actually execute)
+                ml_tag = f".mem{ml}mb" if ml is not None else ""
+                short = _short_hash_tag(combo2, {"file": display_base, "mem": "" if ml is None else str(ml)})
+                log = ns.out_dir / f"{safe_base}.{algo_name}.{short}.{run_tag}-{next(run_ids):04x}{ml_tag}.{stamp}.log"
+                # Compose a descriptive header inside the log
+                log_header = _compose_log_header(stamp, algo_name, display_base, use_path, cmd, combo2, ml)
+                task: RunTask = {
+                    "cmd": cmd,
+                    "input": use_path,
+                    "log": log,
+                    "log_header": log_header,
+                    "memlimit_mb": ml,
+                    "required_keys": required,
+                    "warmup_runs": 0,
+                    "warmup_seconds": 0.0,
+                    "cold": False,
+                    "verbose": ns.verbose,
                 }
-                log_header = "# bench_runner header\n" + json.dumps(header_map, sort_keys=True) + "\n# ---- output ----\n"
-                rc, lines = run_with_streaming(cmd, use_path, log, ns.verbose, memlimit_mb=ml, log_header=log_header)
-                ok = False
-                try:
-                    m = _parse_required_keys(lines, required_keys)
-                    if m is not None:
-                        row_vals: List[str] = []
-                        for col in header:
-                            if col == "file": row_vals.append(display_base)
-                            elif col == "memlimit_mb": row_vals.append("" if ml is None else str(ml))
-                            else: row_vals.append(m.get(col, combo2.get(col, "")))
-                        # Post-run skip-existing (safety)
-                        if keys is not None:
-                            key_cols = csv_cfg.get("key_cols", [])
-                            try:
-                                key = ",".join(row_vals[i] for i in key_cols if isinstance(i, int))
-                                if key and key in keys:
-                                    vprint(ns.verbose, f"Skip existing: {key}")
-                                    ok = True
-                                    continue
-                            except Exception:
-                                pass
-                        csv_append(csv_path, header, row_vals)
-                        ok = True
-                finally:
-                    if ok:
-                        try: log.unlink()
-                        except Exception: pass
-                    else:
-                        vprint(True, f"[warn] No summary parsed or run failed; kept log: {log}")
-
-        if cached_path is not None:
-            try:
-                cached_path.unlink()
-            except Exception:
-                pass
-
-    return 0
+                ctx = (display_base, ml, combo2, log, fpath)
+                in_flight[fpath] += 1
+                if pool is None:
+                    _record(ctx, _run_one(task))
+                else:
+                    pending.append((pool.submit(_run_one, task), ctx))
+                    _drain(max_pending)
+
+            # Serial runs are done; with a pool the cache goes once the file's last run is recorded
+            _release(fpath)
+
+        _drain(0)
+        return 0
+    finally:
+        # Queued runs must not start once their input is gone
+        for fut, _ctx in pending:
+            fut.cancel()
+        _cleanup_caches()
+        atexit.unregister(_cleanup_caches)
 
 
 # -------------- CLI --------------
@@ -1177,7 +1833,10 @@ def parse_str_list(s: str) -> List[str]:
     return [x.strip() for x in s.split(',') if x.strip() != '']
 
 
-def main(argv: Optional[Sequence[str]] = None) -> int:
+@functools.lru_cache(maxsize=4)
+def _build_parser(registry_path: Path, mtime_ns: Optional[int]) -> Tuple[argparse.ArgumentParser, Dict[str, AlgorithmRegistryEntry]]:
+    """Build the CLI parser (one subparser per registry algorithm). Memoized per registry (path, mtime)
+    so long-lived callers of main() don't rebuild the subparser tree every time."""
     p = argparse.ArgumentParser(description="Benchmark runner")
     sub = p.add_subparsers(dest="algo", required=True)
 
@@ -1185,7 +1844,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     # Dynamic algorithms from registry
     try:
-        registry = _load_algorithms_registry()
+        registry = _load_algorithms_registry_cached(registry_path, mtime_ns)
     except Exception:
         registry = {}
     builtins = {"config"}
@@ -1208,7 +1867,11 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     sp_cfg = sub.add_parser("config", help="Run algorithms from a JSON/YAML config file")
     sp_cfg.add_argument("--file", type=Path, required=True, help="Path to config file (.json or .yaml)")
     sp_cfg.add_argument("-v","--verbose", action="store_true")
+    return p, registry
+
 
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    p, registry = _build_parser(*_registry_cache_key())
     ns = p.parse_args(argv)
 
     # Normalize reuse_csv defaults for dynamic algorithms
@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import functools
+import os
 from pathlib import Path
 from typing import Dict, Iterable, Tuple, Union
 
@@ -14,18 +16,27 @@ Color = Tuple[float, float, float]
 
 def extract_hash_from_filename(name: str) -> str:
     """Return the leading hash segment (text before the first '-') or an empty string."""
-    segment = Path(name).name
-    dash = segment.find("-")
-    return segment[:dash] if dash > 0 else ""
+    head, sep, _ = os.path.basename(name).partition("-")
+    return head if sep else ""
 
 
 def load_family_map(meta_csv: PathLike) -> Dict[str, str]:
-    """Load meta.csv and return a mapping of hash -> family."""
+    """Load meta.csv and return a mapping of hash -> family.
+
+    Results are cached per (resolved path, mtime) for the life of the process, so repeated
+    calls (e.g. several plots in one run) parse the file once. Treat the returned dict as read-only.
+    """
+    path = Path(meta_csv).resolve()
+    return _load_family_map_cached(str(path), os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_family_map_cached(meta_csv: str, _mtime_ns: int) -> Dict[str, str]:
     df = pd.read_csv(meta_csv)
     if not {"hash", "family"}.issubset(df.columns):
         raise ValueError("meta.csv must contain 'hash' and 'family' columns")
-    # Later rows win when duplicates exist to keep behaviour predictable.
-    return {str(row["hash"]): str(row["family"]) for _, row in df.iterrows()}
+    # Later rows win when duplicates exist to keep behaviour predictable (dict(zip) keeps the last).
+    return dict(zip(df["hash"].astype(str).to_numpy(), df["family"].astype(str).to_numpy()))
 
 
 def families_for_csvs(paths: Iterable[Path], meta_csv: PathLike) -> Dict[Path, str]:
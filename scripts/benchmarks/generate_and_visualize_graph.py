@@ -3,7 +3,8 @@
 Generate graph CSVs (segmentation and VIG) for a given CNF file, then visualize them.
 
 Behavior:
-  - If input ends with .xz, stream-decompress via `xz -dc` and pipe into binaries.
+  - If input ends with .xz, decompress it once (in-process, stdlib lzma) to a temp .cnf
+    that both binaries read; the temp file is removed afterwards.
   - Writes graph CSVs to scripts/benchmarks/out/graphs/graph_output.{seg|vig}.(node|edges).csv
   - Renders PNGs next to them via visualize_graph.py.
 
@@ -11,7 +12,6 @@ Requirements:
   - Built binaries:
       build/algorithms/segmentation/segmentation
       build/algorithms/vig_info/vig_info
-  - Tools: xz (for .xz inputs)
   - Python deps (for visualization): matplotlib, networkx
 
 Usage:
@@ -21,11 +21,15 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import lzma
 import os
 import shlex
+import shutil
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
+from typing import List
 
 
 def repo_root() -> Path:
@@ -33,21 +37,33 @@ def repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
-def run(cmd, *, stdin=None, cwd: Path | None = None) -> None:
-    # Pretty print and run a command, raising on failure
-    print(f"$ {cmd if isinstance(cmd, str) else ' '.join(map(shlex.quote, cmd))}")
+def run(cmd: List[str], *, stdin=None, cwd: Path | None = None) -> None:
+    # Pretty print and run a command (argv list, no shell), raising on failure
+    print(f"$ {' '.join(map(shlex.quote, cmd))}")
     try:
-        if isinstance(cmd, str):
-            res = subprocess.run(cmd, shell=True, stdin=stdin, cwd=str(cwd) if cwd else None, check=True)
-        else:
-            res = subprocess.run(cmd, stdin=stdin, cwd=str(cwd) if cwd else None, check=True)
+        subprocess.run(cmd, stdin=stdin, cwd=str(cwd) if cwd else None, check=True)
     finally:
         if stdin is not None and hasattr(stdin, "close"):
             try:
                 stdin.close()  # close pipe to avoid broken pipe in producers
             except Exception:
                 pass
-    return None
+
+
+def decompress_xz_to_temp(src: Path) -> Path:
+    # Decompress once so both binaries read the same plain CNF (prefer tmpfs when available)
+    shm = Path("/dev/shm")
+    tmp_dir = str(shm) if shm.is_dir() and os.access(shm, os.W_OK) else None
+    with tempfile.NamedTemporaryFile(prefix="graph_input_", suffix=".cnf", delete=False, dir=tmp_dir) as out:
+        tmp_path = Path(out.name)
+        try:
+            with lzma.open(src, "rb") as f:
+                shutil.copyfileobj(f, out, 1 << 20)
+        except BaseException:
+            out.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+    return tmp_path
 
 
 def ensure_exists(path: Path, kind: str) -> None:
@@ -84,28 +100,17 @@ def main() -> None:
     seg_prefix = out_dir / "graph_output.seg"
     vig_prefix = out_dir / "graph_output.vig"
 
-    # Build commands
+    # Execute graph generation (.xz inputs are decompressed once and shared by both binaries)
     is_xz = in_path.suffix == ".xz"
-    seg_cmd = [str(seg_bin), "-i", "-" if is_xz else str(in_path), "--graph-out", str(seg_prefix), "-t", "0", "--tau", "50", "--k", "300"]
-    vig_cmd = [str(vig_bin), "-i", "-" if is_xz else str(in_path), "--graph-out", str(vig_prefix), "-t", "0", "--tau", "50"]
-
-    # Execute graph generation
-    if is_xz:
-        # xz -dc <file> | <bin> -i - ...
-        xz_proc = subprocess.Popen(["xz", "-dc", str(in_path)], stdout=subprocess.PIPE)
-        try:
-            run(seg_cmd, stdin=xz_proc.stdout)
-        finally:
-            xz_proc.wait()
-
-        xz_proc2 = subprocess.Popen(["xz", "-dc", str(in_path)], stdout=subprocess.PIPE)
-        try:
-            run(vig_cmd, stdin=xz_proc2.stdout)
-        finally:
-            xz_proc2.wait()
-    else:
+    cnf_path = decompress_xz_to_temp(in_path) if is_xz else in_path
+    try:
+        seg_cmd = [str(seg_bin), "-i", str(cnf_path), "--graph-out", str(seg_prefix), "-t", "0", "--tau", "50", "--k", "300"]
+        vig_cmd = [str(vig_bin), "-i", str(cnf_path), "--graph-out", str(vig_prefix), "-t", "0", "--tau", "50"]
         run(seg_cmd)
         run(vig_cmd)
+    finally:
+        if is_xz:
+            cnf_path.unlink(missing_ok=True)
 
     # Visualize both
     in_base = in_path.name
@@ -4,13 +4,26 @@
 from __future__ import annotations
 
 import argparse
+import csv
 import json
+import os
+import re
 from collections import Counter
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
+import matplotlib
+
+# Output is PNG only; pin Agg so a desktop session never initializes a GUI backend
+# (the plot workers are forked, and GUI toolkits are not fork-safe).
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import numpy as np
 import pandas as pd
 from numpy.typing import NDArray
@@ -24,18 +37,59 @@ DEFAULT_OUT_DIR = "scripts/benchmarks/out/component_size_plots"
 DEFAULT_RESULTS_CSV = "scripts/benchmarks/out/segmentation_results.csv"
 DEFAULT_FILTER_CONFIG = "scripts/benchmarks/configs/segmentation_results_filters.example.json"
 ID_MAP_FILENAME = "combined_size_id_map.csv"
+COMPONENTS_SUFFIX = "_components.csv"
+CACHE_SUFFIX = ".sizes.npz"
+CACHE_VERSION = 2
+CACHE_MIN_BYTES = 32 << 10
+NUMBA_MIN_SIZE = 1 << 20
+# Fast zlib level for PNG output: ~60% larger files, noticeably cheaper writes at dpi=300.
+# Plots are already fitted by tight_layout(), so they skip savefig's bbox_inches="tight" re-render.
+PNG_PIL_KWARGS = {"compress_level": 1}
+# Curves longer than this are log-sampled before plotting (see _log_sample).
+PLOT_MAX_POINTS = 1500
+
+# Only these columns are parsed from *_components.csv; the rest are skipped by the C reader.
+_COMPONENT_COLUMNS = frozenset({"size", "min_internal_weight"})
+_SIZE_COLUMNS = frozenset({"size"})
+_COMPONENT_DTYPES = {"size": "float64", "min_internal_weight": "float64"}
 
 _ID_ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
 _ID_BASE = len(_ID_ALPHABET)
 _ID_WIDTH = 3
+_ID_CHARS = np.array(list(_ID_ALPHABET), dtype="<U1")
+# Anything but letters, digits, "-", "." and "_" becomes "_", then underscore runs collapse.
+_SLUG_UNSAFE_RE = re.compile(r"[^\w.-]+")
+_SLUG_UNDERSCORES_RE = re.compile(r"__+")
 
 PathLike = Union[str, Path]
 NumericFilterConfig = Dict[str, Dict[str, float]]
-ResultsIndex = Dict[str, Dict[str, Any]]
 IntArray = NDArray[np.int_]
 FloatArray = NDArray[np.float64]
 
 
+@dataclass
+class ResultsIndex:
+    """Column-oriented segmentation results for the filter columns, addressed by instance hash.
+
+    ``columns[name]`` holds (values, valid) arrays aligned with ``positions``; a cell that is
+    present but not numeric has ``valid`` False. ``passing`` lists hashes meeting every threshold.
+    """
+
+    positions: Dict[str, int]
+    columns: Dict[str, Tuple[FloatArray, NDArray[np.bool_]]]
+    passing: FrozenSet[str]
+
+
+@dataclass
+class ComponentArrays:
+    """Arrays loaded for one component CSV: parsed columns plus derived curve values."""
+
+    sizes: IntArray
+    weights: Optional[FloatArray]
+    coverage: FloatArray
+    avg_weight: Optional[FloatArray]
+
+
 @dataclass
 class ComponentSeries:
     """In-memory representation of a component CSV file."""
@@ -55,49 +109,131 @@ class ComponentSeries:
             return False
         return bool(np.isfinite(self.weights).any())
 
+    # Curves are memoized: the combined and per-family plots draw every series twice.
+    _coverage: Optional[Tuple[IntArray, FloatArray]] = field(default=None, init=False, repr=False, compare=False)
+    _avg_weight: Optional[Tuple[IntArray, FloatArray]] = field(default=None, init=False, repr=False, compare=False)
+    _avg_bounds: Optional[Tuple[float, float]] = field(default=None, init=False, repr=False, compare=False)
+    _curves_ready: bool = field(default=False, init=False, repr=False, compare=False)
+
     def coverage_curve(self) -> Tuple[IntArray, FloatArray]:
-        if self.sizes.size == 0:
-            return np.array([], dtype=np.int_), np.array([], dtype=np.float64)
-        sorted_sizes = np.sort(self.sizes)[::-1]
-        cumulative = np.cumsum(sorted_sizes, dtype=np.float64)
-        total = float(sorted_sizes.sum())
-        if total <= 0:
-            return np.array([], dtype=np.int_), np.array([], dtype=np.float64)
-        x = np.arange(1, sorted_sizes.size + 1, dtype=np.int_)
-        y = (cumulative / total) * 100.0
-        return x, y.astype(np.float64)
+        self._ensure_curves()
+        assert self._coverage is not None
+        return self._coverage
 
     def avg_weight_curve(self) -> Optional[Tuple[IntArray, FloatArray]]:
-        if not self.has_weights() or self.weights is None:
-            return None
-        order = np.argsort(self.sizes)[::-1]
-        sorted_weights = np.asarray(self.weights[order], dtype=np.float64)
-        finite_mask = np.isfinite(sorted_weights)
-        cumulative_weight = np.cumsum(np.where(finite_mask, sorted_weights, 0.0), dtype=np.float64)
-        cumulative_count = np.cumsum(finite_mask.astype(np.int_))
-        averages = np.divide(
-            cumulative_weight,
-            cumulative_count,
-            out=np.full_like(cumulative_weight, np.nan, dtype=np.float64),
-            where=cumulative_count > 0,
-        )
-        x = np.arange(1, sorted_weights.size + 1, dtype=np.int_)
-        return x, averages.astype(np.float64)
+        self._ensure_curves()
+        return self._avg_weight
+
+    def avg_weight_bounds(self) -> Optional[Tuple[float, float]]:
+        """Return (min, max) of the positive finite averages, or None when there are none."""
+        self._ensure_curves()
+        return self._avg_bounds
+
+    def set_curves(self, coverage: FloatArray, avg_weight: Optional[FloatArray]) -> None:
+        """Install curve values from _derive_curves (e.g. loaded from the sidecar cache)."""
+        ranks = np.arange(1, self.sizes.size + 1, dtype=np.int_)
+        self._coverage = (ranks[: coverage.size], coverage)
+        self._avg_weight = None
+        self._avg_bounds = None
+        if avg_weight is not None:
+            self._avg_weight = (ranks, avg_weight)
+            finite = avg_weight[np.isfinite(avg_weight) & (avg_weight > 0)]
+            if finite.size > 0:
+                self._avg_bounds = (float(finite.min()), float(finite.max()))
+        self._curves_ready = True
+
+    def _ensure_curves(self) -> None:
+        if not self._curves_ready:
+            weights = self.weights if self.has_weights() else None
+            self.set_curves(*_derive_curves(self.sizes, weights))
 
 
-def _base62_id(idx: int) -> str:
-    """Return a stable three-character base62 identifier for legend labels."""
-    max_ids = _ID_BASE ** _ID_WIDTH
-    if idx < 0 or idx >= max_ids:
+@dataclass
+class PlotCurves:
+    """Log-sampled curves of one series: all a plot task needs from it (cheap to pickle)."""
+
+    family: str
+    identifier: str
+    coverage: Tuple[IntArray, FloatArray]
+    avg_weight: Optional[Tuple[IntArray, FloatArray]] = None
+    avg_bounds: Optional[Tuple[float, float]] = None
+
+
+def _derive_curves(sizes: IntArray, weights: Optional[FloatArray]) -> Tuple[FloatArray, Optional[FloatArray]]:
+    """Return coverage percentages and (when *weights* has finite values) running avg weights.
+
+    Both are indexed by rank in size-descending order; coverage is empty when sizes sum to 0.
+    """
+    if weights is None or weights.shape != sizes.shape or not np.isfinite(weights).any():
+        return _coverage_values(np.sort(sizes)[::-1]), None
+    # The avg curve needs the argsort anyway; gathering sizes through it beats a second sort.
+    order = np.argsort(sizes)[::-1]
+    return _coverage_values(sizes[order]), _running_finite_mean(np.asarray(weights[order], dtype=np.float64))
+
+
+def _coverage_values(sorted_sizes: IntArray) -> FloatArray:
+    """Percent of the total covered by the top-n of the size-descending *sorted_sizes*."""
+    if sorted_sizes.size == 0:
+        return np.array([], dtype=np.float64)
+    # Integer prefix sums are exact and skip the per-element float cast of a float64 cumsum.
+    cumulative = np.cumsum(sorted_sizes, dtype=np.int64)
+    total = float(cumulative[-1])
+    if total <= 0:
+        return np.array([], dtype=np.float64)
+    y = cumulative / total
+    y *= 100.0
+    return y
+
+
+def _running_finite_mean_loop(values: FloatArray) -> FloatArray:
+    """Single-pass running mean over the finite entries of *values* (NaN until the first one)."""
+    out = np.empty(values.size, dtype=np.float64)
+    total = 0.0
+    count = 0
+    for i in range(values.size):
+        value = values[i]
+        if np.isfinite(value):
+            total += value
+            count += 1
+        out[i] = total / count if count > 0 else np.nan
+    return out
+
+
+@lru_cache(maxsize=1)
+def _numba_running_mean() -> Optional[Callable[[FloatArray], FloatArray]]:
+    """Return the numba-compiled running-mean kernel, or None when numba is not installed."""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_running_finite_mean_loop)
+
+
+def _running_finite_mean(values: FloatArray) -> FloatArray:
+    """Running mean of the finite *values*, NaN while none have been seen yet."""
+    # numba is optional and costs ~0.4 s to import, so only large series use the fused kernel.
+    if values.size >= NUMBA_MIN_SIZE:
+        kernel = _numba_running_mean()
+        if kernel is not None:
+            return kernel(values)
+    finite_mask = np.isfinite(values)
+    averages = np.where(finite_mask, values, 0.0)
+    np.cumsum(averages, out=averages)
+    # Before the first finite value both sums are 0, and 0/0 yields the NaN we want.
+    with np.errstate(invalid="ignore"):
+        averages /= np.cumsum(finite_mask)
+    return averages
+
+
+def _base62_ids(count: int) -> List[str]:
+    """Return the stable three-character base62 identifiers for indices ``0..count-1``."""
+    if count > _ID_BASE ** _ID_WIDTH:
         raise ValueError(f"ID capacity exceeded for width={_ID_WIDTH} and base={_ID_BASE}")
-    chars: List[str] = []
-    value = idx
-    for _ in range(_ID_WIDTH):
-        chars.append(_ID_ALPHABET[value % _ID_BASE])
-        value //= _ID_BASE
-    while len(chars) < _ID_WIDTH:
-        chars.append(_ID_ALPHABET[0])
-    return "".join(reversed(chars))
+    # Most significant digit first; each row of the digit matrix becomes one ID.
+    place_values = _ID_BASE ** np.arange(_ID_WIDTH - 1, -1, -1)
+    digits = (np.arange(count)[:, None] // place_values) % _ID_BASE
+    chars = np.ascontiguousarray(_ID_CHARS[digits])
+    return chars.view(f"<U{_ID_WIDTH}").ravel().tolist()
 
 
 def ensure_dir(directory: Path) -> None:
@@ -105,9 +241,30 @@ def ensure_dir(directory: Path) -> None:
     directory.mkdir(parents=True, exist_ok=True)
 
 
+def _iter_component_csvs(directory: str) -> Iterator[str]:
+    # Same order as Path.rglob: a directory's matches first, then its subdirectories (no
+    # symlinked dirs). Names are matched before is_file(), which reuses the DirEntry cache.
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs: List[str] = []
+    for entry in entries:
+        try:
+            if entry.name.endswith(COMPONENTS_SUFFIX) and entry.is_file():
+                yield entry.path
+            elif entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+        except OSError:
+            continue
+    for subdir in subdirs:
+        yield from _iter_component_csvs(subdir)
+
+
 def find_component_csvs(root: Path) -> List[Path]:
     """Return every *_components.csv file found under *root*."""
-    return [path for path in root.rglob("*_components.csv") if path.is_file()]
+    return list(map(Path, _iter_component_csvs(str(root))))
 
 
 def parse_labels_from_path(path: Path, in_root: Optional[Path]) -> Tuple[str, Optional[str], Optional[str]]:
@@ -138,23 +295,184 @@ def parse_labels_from_path(path: Path, in_root: Optional[Path]) -> Tuple[str, Op
     return display_name, tau, kval
 
 
-def _load_sizes_and_weights(csv_path: Path) -> Tuple[IntArray, Optional[FloatArray]]:
-    """Load component sizes and optional weights, filtering zero-sized components."""
-    df = pd.read_csv(csv_path)
-    if "size" not in df.columns:
+def _cache_path(csv_path: Path) -> Path:
+    """Return the sidecar ``.sizes.npz`` path caching arrays parsed from *csv_path*."""
+    return csv_path.with_suffix(CACHE_SUFFIX)
+
+
+def _read_cached_arrays(cache: Path, stamp: Tuple[int, int, int]) -> Optional[ComponentArrays]:
+    """Return cached arrays when *cache* was written for the same source *stamp*."""
+    try:
+        with np.load(cache, allow_pickle=False) as data:
+            if tuple(int(v) for v in data["stamp"]) != stamp:
+                return None
+            files = set(data.files)
+            return ComponentArrays(
+                sizes=np.asarray(data["sizes"], dtype=np.int_),
+                weights=np.asarray(data["weights"], dtype=np.float64) if "weights" in files else None,
+                coverage=np.asarray(data["coverage"], dtype=np.float64),
+                avg_weight=np.asarray(data["avg_weight"], dtype=np.float64) if "avg_weight" in files else None,
+            )
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _write_cached_arrays(cache: Path, stamp: Tuple[int, int, int], arrays: ComponentArrays) -> None:
+    """Atomically persist parsed arrays next to their CSV; failures only cost the cache."""
+    payload: Dict[str, Any] = {
+        "stamp": np.asarray(stamp, dtype=np.int64),
+        "sizes": arrays.sizes,
+        "coverage": arrays.coverage,
+    }
+    if arrays.weights is not None:
+        payload["weights"] = arrays.weights
+    if arrays.avg_weight is not None:
+        payload["avg_weight"] = arrays.avg_weight
+    tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as handle:
+            np.savez(handle, **payload)
+        os.replace(tmp, cache)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _load_component_arrays(csv_path: Path, use_cache: bool = True, load_weights: bool = True) -> ComponentArrays:
+    """Load sizes, weights and their derived curves, reusing the sidecar cache when fresh.
+
+    With *load_weights* False only the size column is parsed and weights come back as None.
+    """
+    st = csv_path.stat() if use_cache else None
+    # Opening an npz costs ~0.6 ms, more than parsing a small CSV, so small files skip the cache.
+    if st is None or st.st_size < CACHE_MIN_BYTES:
+        return _parse_component_arrays(csv_path, load_weights)
+    # Key on (format, mtime_ns, size) so edited CSVs or changed curve code invalidate the cache.
+    stamp = (CACHE_VERSION, st.st_mtime_ns, st.st_size)
+    cache = _cache_path(csv_path)
+    cached = _read_cached_arrays(cache, stamp)
+    if cached is not None:
+        return cached if load_weights else ComponentArrays(cached.sizes, None, cached.coverage, None)
+    arrays = _parse_component_arrays(csv_path, load_weights)
+    # Size-only parses are not cached, so later runs that plot weights never read a weightless entry.
+    if load_weights:
+        _write_cached_arrays(cache, stamp, arrays)
+    return arrays
+
+
+def _parse_component_arrays(csv_path: Path, load_weights: bool) -> ComponentArrays:
+    """Parse *csv_path* and derive its curves without touching the cache."""
+    sizes, weights = _parse_sizes_and_weights(csv_path, load_weights)
+    return ComponentArrays(sizes, weights, *_derive_curves(sizes, weights))
+
+
+@lru_cache(maxsize=1)
+def _pyarrow_csv() -> Optional[Any]:
+    """Return the pyarrow.csv module, or None when pyarrow is not installed."""
+    try:
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return None
+    return pa_csv
+
+
+def _read_component_columns_arrow(csv_path: Path, wanted: FrozenSet[str]) -> Optional[Dict[str, NDArray[Any]]]:
+    """Read sizes as int64 and weights as float64 with pyarrow; None if unavailable or not parseable."""
+    pa_csv = _pyarrow_csv()
+    if pa_csv is None:
+        return None
+    import pyarrow as pa
+
+    try:
+        table = pa_csv.read_csv(
+            csv_path,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=sorted(wanted),
+                include_missing_columns=False,
+                column_types={"size": pa.int64(), "min_internal_weight": pa.float64()},
+            ),
+        )
+    except (pa.ArrowInvalid, pa.ArrowKeyError):
+        # Missing columns, non-numeric cells or fractional sizes: let the pandas path handle them.
+        return None
+    columns: Dict[str, NDArray[Any]] = {}
+    if "size" in table.column_names:
+        # Blank sizes count as 0; a single null-free chunk converts without copying.
+        sizes = table.column("size")
+        columns["size"] = (sizes.fill_null(0) if sizes.null_count else sizes).to_numpy()
+    if "min_internal_weight" in table.column_names:
+        # Nulls (blank cells) come out as NaN, matching pandas' float64 parsing.
+        columns["min_internal_weight"] = table.column("min_internal_weight").to_numpy()
+    return columns
+
+
+def _read_component_columns(csv_path: Path, wanted: FrozenSet[str] = _COMPONENT_COLUMNS) -> Dict[str, NDArray[Any]]:
+    """Read whichever of the *wanted* columns exist; non-numeric cells become NaN (pandas path)."""
+    columns = _read_component_columns_arrow(csv_path, wanted)
+    if columns is not None:
+        return columns
+    try:
+        df = pd.read_csv(
+            csv_path,
+            usecols=wanted.__contains__,
+            # float64 keeps blank sizes as NaN without the slow nullable Int64 path.
+            dtype=_COMPONENT_DTYPES,
+            engine="c",
+            memory_map=True,
+        )
+        return {name: df[name].to_numpy(dtype=np.float64) for name in df.columns}
+    except ValueError:
+        # Non-numeric cells: retry untyped and coerce them to NaN.
+        df = pd.read_csv(csv_path, usecols=wanted.__contains__, engine="c", memory_map=True)
+        return {name: pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=np.float64) for name in df.columns}
+
+
+def _parse_sizes_and_weights(csv_path: Path, load_weights: bool = True) -> Tuple[IntArray, Optional[FloatArray]]:
+    """Parse component sizes and optional weights, filtering zero-sized components."""
+    columns = _read_component_columns(csv_path, _COMPONENT_COLUMNS if load_weights else _SIZE_COLUMNS)
+    if "size" not in columns:
         return np.array([], dtype=np.int_), None
-    sizes_numeric = pd.to_numeric(df["size"], errors="coerce").fillna(0).astype(int)
-    mask = sizes_numeric > 0
-    sizes = np.asarray(sizes_numeric[mask], dtype=np.int_)
+    all_sizes = columns["size"]
+    if all_sizes.dtype.kind == "f":
+        # Blank sizes count as 0; truncate before masking so fractional sizes below 1 drop out.
+        all_sizes = np.nan_to_num(all_sizes, nan=0.0).astype(np.int_)
+    mask = all_sizes > 0
+    keep_all = np.count_nonzero(mask) == mask.size
+    sizes = all_sizes if keep_all else all_sizes[mask]
 
     weights: Optional[FloatArray] = None
-    if "min_internal_weight" in df.columns:
-        weights_series = pd.to_numeric(df["min_internal_weight"], errors="coerce")
-        weights_masked = weights_series[mask].fillna(np.nan)
-        weights = np.asarray(weights_masked, dtype=np.float64)
+    raw_weights = columns.get("min_internal_weight")
+    if raw_weights is not None:
+        weights = raw_weights if keep_all else raw_weights[mask]
     return sizes, weights
 
 
+def _load_arrays_or_error(
+    csv_path: Path, use_cache: bool, load_weights: bool
+) -> Tuple[Optional[ComponentArrays], Optional[str]]:
+    """Worker wrapper returning (arrays, None) or (None, error) for one CSV."""
+    try:
+        return _load_component_arrays(csv_path, use_cache, load_weights), None
+    except Exception as exc:
+        return None, str(exc)
+
+
+def _load_all_arrays(
+    csv_paths: Sequence[Path], use_cache: bool, jobs: int, load_weights: bool = True
+) -> Iterable[Tuple[Optional[ComponentArrays], Optional[str]]]:
+    """Load every CSV in order, fanning out over *jobs* worker processes when > 1."""
+    workers = min(jobs, len(csv_paths))
+    if workers <= 1:
+        return list(map(_load_arrays_or_error, csv_paths, repeat(use_cache), repeat(load_weights)))
+    chunksize = max(1, min(8, len(csv_paths) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(_load_arrays_or_error, csv_paths, repeat(use_cache), repeat(load_weights), chunksize=chunksize)
+        )
+
+
 def _load_filter_config(path: Optional[Path]) -> Optional[NumericFilterConfig]:
     """Parse optional JSON filter thresholds for segmentation result pruning."""
     if path is None or not path.exists():
@@ -172,51 +490,69 @@ def _load_filter_config(path: Optional[Path]) -> Optional[NumericFilterConfig]:
     return cfg
 
 
-def _load_results_index(results_csv: Path) -> ResultsIndex:
-    """Return segmentation results keyed by hash extracted from their file field."""
+def _load_results_index(results_csv: Path, flt: Optional[NumericFilterConfig] = None) -> ResultsIndex:
+    """Return segmentation results keyed by hash extracted from their file field.
+
+    Only the *flt* columns are kept, coerced to float arrays once (non-numeric cells are
+    marked invalid so filters report them as missing). Thresholds are evaluated column-wise
+    here, so per-file checks reduce to a set lookup.
+    """
     if not results_csv.exists():
         raise FileNotFoundError(f"Results CSV not found: {results_csv}")
     df = pd.read_csv(results_csv)
     if "file" not in df.columns:
         raise ValueError("segmentation_results.csv must contain a 'file' column")
-    index: ResultsIndex = {}
-    for _, row in df.iterrows():
-        hash_id = extract_hash_from_filename(str(row["file"]))
-        if hash_id:
-            index[hash_id] = {column: row[column] for column in df.columns}
-    return index
-
-
-def _row_value(row: Dict[str, Any], key: str) -> Optional[float]:
-    """Best-effort conversion of a results row field into a float for comparisons."""
-    value = row.get(key)
-    if value is None:
+    # Results hold one row per configuration; keeping each file's last row up front leaves
+    # the per-name hash split (and the column coercion below) far fewer rows to process.
+    df = df.drop_duplicates("file", keep="last")
+    # pandas >= 3 keeps blank cells as NA through astype(str); they have no hash either way.
+    hashes = df["file"].astype(str).fillna("").map(extract_hash_from_filename)
+    keep = hashes.astype(bool).to_numpy()
+    df = df[keep].set_axis(hashes[keep].to_numpy())
+    # Later rows win on duplicate hashes, as with the previous row-by-row build.
+    df = df[~df.index.duplicated(keep="last")]
+
+    flt = flt or {}
+    columns: Dict[str, Tuple[FloatArray, NDArray[np.bool_]]] = {}
+    for column in {*flt.get("min", {}), *flt.get("max", {})}.intersection(df.columns):
+        raw = df[column]
+        numeric = pd.to_numeric(raw, errors="coerce")
+        valid = (numeric.notna() | raw.isna()).to_numpy()
+        columns[column] = (numeric.to_numpy(dtype=np.float64), valid)
+
+    passing = np.ones(len(df), dtype=bool)
+    for bound in ("min", "max"):
+        for column, threshold in flt.get(bound, {}).items():
+            if column not in columns:
+                passing[:] = False
+                continue
+            values, valid = columns[column]
+            # NaN (blank) cells compare False and therefore pass, matching _passes_filters.
+            failed = values < threshold if bound == "min" else values > threshold
+            passing &= valid & ~failed
+    positions = {hash_id: pos for pos, hash_id in enumerate(df.index)}
+    return ResultsIndex(positions=positions, columns=columns, passing=frozenset(df.index[passing]))
+
+
+def _row_value(index: ResultsIndex, pos: int, key: str) -> Optional[float]:
+    """Return the results field *key* of row *pos* as a float, or None when missing."""
+    column = index.columns.get(key)
+    if column is None:
         return None
-    if isinstance(value, (int, float, np.integer, np.floating)):
-        return float(value)
-    try:
-        return float(str(value))
-    except (TypeError, ValueError):
-        try:
-            numeric = pd.to_numeric([value], errors="coerce")
-        except Exception:
-            return None
-        result = float(numeric[0])
-        if np.isnan(result):
-            return None
-        return result
+    values, valid = column
+    return float(values[pos]) if valid[pos] else None
 
 
-def _passes_filters(row: Dict[str, Any], flt: NumericFilterConfig) -> Tuple[bool, Optional[str]]:
-    """Return (True, None) if *row* satisfies thresholds; otherwise details of the failure."""
+def _passes_filters(index: ResultsIndex, pos: int, flt: NumericFilterConfig) -> Tuple[bool, Optional[str]]:
+    """Return (True, None) if row *pos* satisfies thresholds; otherwise details of the failure."""
     for key, threshold in flt.get("min", {}).items():
-        value = _row_value(row, key)
+        value = _row_value(index, pos, key)
         if value is None:
             return False, f"missing value for '{key}' (required min {threshold})"
         if value < threshold:
             return False, f"min filter '{key}' failed: {value} < {threshold}"
     for key, threshold in flt.get("max", {}).items():
-        value = _row_value(row, key)
+        value = _row_value(index, pos, key)
         if value is None:
             return False, f"missing value for '{key}' (required max {threshold})"
         if value > threshold:
@@ -226,11 +562,7 @@ def _passes_filters(row: Dict[str, Any], flt: NumericFilterConfig) -> Tuple[bool
 
 def _slugify(text: str) -> str:
     """Generate a filesystem-safe slug from *text* for PNG filenames."""
-    safe = [ch if ch.isalnum() or ch in {"-", "."} else "_" for ch in text]
-    slug = "".join(safe)
-    while "__" in slug:
-        slug = slug.replace("__", "_")
-    slug = slug.strip("_")
+    slug = _SLUG_UNDERSCORES_RE.sub("_", _SLUG_UNSAFE_RE.sub("_", text)).strip("_")
     return slug or "family"
 
 
@@ -259,43 +591,61 @@ def load_component_series(
     in_root: Optional[Path],
     filter_cfg: Optional[NumericFilterConfig],
     results_index: Optional[ResultsIndex],
+    use_cache: bool = True,
+    jobs: int = 1,
+    load_weights: bool = True,
 )  -> List[ComponentSeries]:
     """Materialize ComponentSeries objects after applying size and results filters."""
+    # Results filters only need the file name, so rejected CSVs are never parsed.
+    candidates = [path for path in csv_paths if _passes_results_filters(path, filter_cfg, results_index)]
     series: List[ComponentSeries] = []
-    for csv_path in csv_paths:
-        try:
-            sizes, weights = _load_sizes_and_weights(csv_path)
-        except Exception as exc:
-            print(f"Failed to load {csv_path}: {exc}")
+    loaded = _load_all_arrays(candidates, use_cache, jobs, load_weights)
+    for csv_path, (arrays, error) in zip(candidates, loaded):
+        if arrays is None:
+            print(f"Failed to load {csv_path}: {error}")
             continue
+        sizes, weights = arrays.sizes, arrays.weights
 
         if sizes.size <= 2:
             print(f"Skipping {csv_path} (only {sizes.size} components)")
             continue
 
-        if filter_cfg and results_index:
-            # Hash-based lookup matches segmentation results to component exports.
-            hash_id = extract_hash_from_filename(csv_path.name)
-            row = results_index.get(hash_id)
-            if not row:
-                print(f"Skipping {csv_path} (no results row for hash {hash_id})")
-                continue
-            passes_filters, reason = _passes_filters(row, filter_cfg)
-            if not passes_filters:
-                detail = reason or "failed filter thresholds"
-                print(f"Skipping {csv_path} ({detail})")
-                continue
-
         label = _make_label(csv_path, in_root)
         weights_array = weights if weights is not None and np.isfinite(weights).any() else None
-        series.append(ComponentSeries(label=label, path=csv_path, sizes=sizes, weights=weights_array))
+        record = ComponentSeries(label=label, path=csv_path, sizes=sizes, weights=weights_array)
+        record.set_curves(arrays.coverage, arrays.avg_weight)
+        series.append(record)
     return series
 
 
+def _passes_results_filters(
+    csv_path: Path,
+    filter_cfg: Optional[NumericFilterConfig],
+    results_index: Optional[ResultsIndex],
+) -> bool:
+    """Return whether *csv_path*'s results row passes the filters, printing why when not."""
+    if not filter_cfg or results_index is None or not results_index.positions:
+        return True
+    # Hash-based lookup matches segmentation results to component exports.
+    hash_id = extract_hash_from_filename(csv_path.name)
+    if hash_id in results_index.passing:
+        return True
+    pos = results_index.positions.get(hash_id)
+    if pos is None:
+        print(f"Skipping {csv_path} (no results row for hash {hash_id})")
+        return False
+    # Only rejected files pay for the per-row check, to name the failing threshold.
+    _, reason = _passes_filters(results_index, pos, filter_cfg)
+    detail = reason or "failed filter thresholds"
+    print(f"Skipping {csv_path} ({detail})")
+    return False
+
+
 def assign_identifiers(series: List[ComponentSeries]) -> None:
     """Assign stable legend identifiers to each ComponentSeries instance."""
-    for idx, record in enumerate(sorted(series, key=lambda item: item.label)):
-        setattr(record, "identifier", _base62_id(idx))
+    ordered = sorted(series, key=lambda item: item.label)
+    for record, identifier in zip(ordered, _base62_ids(len(ordered))):
+        setattr(record, "identifier", identifier)
 
 
 def update_families(series: List[ComponentSeries], meta_path: Path) -> None:
@@ -331,9 +681,11 @@ def write_id_map(out_dir: Path, series: Sequence[ComponentSeries], in_root: Opti
                 "n_sizes": record.component_count(),
             }
         )
-    df = pd.DataFrame(rows, columns=["id", "label", "file", "family", "n_sizes"])
     out_path = out_dir / ID_MAP_FILENAME
-    df.to_csv(out_path, index=False)
+    with open(out_path, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=["id", "label", "file", "family", "n_sizes"], lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
     return out_path
 
 
@@ -355,7 +707,7 @@ def compute_valid_families(series: Sequence[ComponentSeries], excluded: Iterable
     if excluded_set:
         print(f"\nExcluding families: {', '.join(sorted(excluded_set))}")
         valid -= excluded_set
-    return dict(counts), sorted(valid)
+    return counts, sorted(valid)
 
 
 def print_family_listing(series: Sequence[ComponentSeries], valid_families: Iterable[str]) -> None:
@@ -394,18 +746,90 @@ def _save_legend_image(handles: Sequence[Any], labels: Sequence[str], out_path:
         title_fontsize=fontsize,
     )
     fig.tight_layout()
-    fig.savefig(out_path.as_posix(), dpi=300, bbox_inches="tight")
+    # Legend extents depend on label lengths, so only these images keep the tight-bbox pass.
+    fig.savefig(out_path.as_posix(), dpi=300, bbox_inches="tight", pil_kwargs=PNG_PIL_KWARGS)
     plt.close(fig)
 
 
+def _log_sample(x: IntArray, y: FloatArray, max_points: int = PLOT_MAX_POINTS) -> Tuple[IntArray, FloatArray]:
+    """Thin a rank-indexed curve to ~*max_points* log-spaced ranks for log-x plotting.
+
+    Every rank is kept at the low end (where log-x spreads them out) and the last rank
+    is always included, so the drawn curve is visually unchanged.
+    """
+    if x.size <= max_points:
+        return x, y
+    idx = np.unique(np.rint(np.geomspace(1, x.size, max_points)).astype(np.int_)) - 1
+    return x[idx], y[idx]
+
+
+def _plot_curves(record: ComponentSeries) -> PlotCurves:
+    """Sample *record*'s curves for plotting; bounds come from the full avg curve."""
+    avg_curve = record.avg_weight_curve()
+    return PlotCurves(
+        family=record.family,
+        identifier=record.identifier,
+        coverage=_log_sample(*record.coverage_curve()),
+        avg_weight=_log_sample(*avg_curve) if avg_curve is not None else None,
+        avg_bounds=record.avg_weight_bounds(),
+    )
+
+
 def _style_sizes(fontsize: float, *, base_line: float, base_marker: float) -> Tuple[float, float]:
     """Scale line width and marker size relative to the reference font size (7pt)."""
     scale = max(fontsize / 10.0, 0.1)
     return base_line * scale, base_marker * scale
 
 
+def _draw_family_overlay(
+    ax: Any,
+    curves: Sequence[Tuple[str, IntArray, FloatArray]],
+    styles: Dict[str, FamilyStyle],
+    line_width: float,
+    marker_size: float,
+) -> Dict[str, Any]:
+    """Draw (family, x, y) curves as one LineCollection plus one marker artist per family.
+
+    Returns legend proxy handles keyed by family, styled like the drawn lines.
+    """
+    collection = LineCollection(
+        [np.column_stack((x, y)) for _, x, y in curves],
+        colors=[styles[family].color for family, _, _ in curves],
+        linestyles=[styles[family].linestyle for family, _, _ in curves],
+        linewidths=line_width,
+        alpha=0.9,
+    )
+    ax.add_collection(collection)
+    handles: Dict[str, Any] = {}
+    for family in dict.fromkeys(family for family, _, _ in curves):
+        style = styles[family]
+        xs = [x for fam, x, _ in curves if fam == family]
+        ys = [y for fam, _, y in curves if fam == family]
+        ax.plot(
+            np.concatenate(xs),
+            np.concatenate(ys),
+            linestyle="none",
+            color=style.color,
+            alpha=0.9,
+            marker=style.marker,
+            markersize=marker_size,
+        )
+        handles[family] = Line2D(
+            [],
+            [],
+            linewidth=line_width,
+            color=style.color,
+            linestyle=style.linestyle,
+            alpha=0.9,
+            marker=style.marker,
+            markersize=marker_size,
+        )
+    ax.autoscale_view()
+    return handles
+
+
 def plot_combined_coverage(
-    series: Sequence[ComponentSeries],
+    curves_by_file: Sequence[PlotCurves],
     valid_families: Iterable[str],
     styles: Dict[str, FamilyStyle],
     out_dir: Path,
@@ -417,35 +841,25 @@ def plot_combined_coverage(
     valid_set = set(valid_families)
     path = out_dir / "combined_topn_coverage.png"
     fig, ax = plt.subplots(figsize=(10, 7))
-    fam_handles: Dict[str, Any] = {}
+    curves: List[Tuple[str, IntArray, FloatArray]] = []
     any_data = False
     line_width, marker_size = _style_sizes(fontsize, base_line=1.5, base_marker=3.0)
-    for record in series:
-        if record.family not in valid_set:
+    for item in curves_by_file:
+        if item.family not in valid_set:
             continue
-        x, y = record.coverage_curve()
+        x, y = item.coverage
         if x.size == 0:
             continue
-        style = styles.get(record.family)
+        style = styles.get(item.family)
         if style is None:
             continue
         any_data = True
-        line, = ax.plot(
-            x,
-            y,
-            linewidth=line_width,
-            color=style.color,
-            linestyle=style.linestyle,
-            alpha=0.9,
-            marker=style.marker,
-            markersize=marker_size,
-            markevery=1,
-        )
-        fam_handles.setdefault(record.family, line)
+        curves.append((item.family, x, y))
 
     if not any_data:
         plt.close(fig)
         return
+    fam_handles = _draw_family_overlay(ax, curves, styles, line_width, marker_size)
 
     ax.set_xscale("log")
     ax.set_xlabel("n (log)", fontsize=fontsize)
@@ -458,12 +872,12 @@ def plot_combined_coverage(
     fig.tight_layout()
     legend_path = path.with_name(f"{path.stem}_legend.png")
     _save_legend_image(handles, labels, legend_path, title="family", fontsize=fontsize)
-    fig.savefig(path.as_posix(), dpi=300, bbox_inches="tight")
+    fig.savefig(path.as_posix(), dpi=300, pil_kwargs=PNG_PIL_KWARGS)
     plt.close(fig)
 
 
 def plot_combined_avg_weights(
-    series: Sequence[ComponentSeries],
+    curves_by_file: Sequence[PlotCurves],
     valid_families: Iterable[str],
     styles: Dict[str, FamilyStyle],
     out_dir: Path,
@@ -475,46 +889,35 @@ def plot_combined_avg_weights(
     valid_set = set(valid_families)
     path = out_dir / "combined_topn_avg_min_internal_weight.png"
     fig, ax = plt.subplots(figsize=(10, 7))
-    fam_handles: Dict[str, Any] = {}
+    curves: List[Tuple[str, IntArray, FloatArray]] = []
     any_data = False
     y_min = np.inf
     y_max = 0.0
     line_width, marker_size = _style_sizes(fontsize, base_line=1.5, base_marker=3.0)
 
-    for record in series:
-        if record.family not in valid_set:
+    for item in curves_by_file:
+        if item.family not in valid_set:
             continue
-        curve = record.avg_weight_curve()
-        if curve is None:
+        if item.avg_weight is None:
             continue
-        x, y = curve
+        x, y = item.avg_weight
         if x.size == 0:
             continue
-        style = styles.get(record.family)
+        style = styles.get(item.family)
         if style is None:
             continue
         any_data = True
         # Track extrema so log-scale limits stay anchored to observed values.
-        finite = y[np.isfinite(y) & (y > 0)]
-        if finite.size > 0:
-            y_min = min(y_min, float(np.min(finite)))
-            y_max = max(y_max, float(np.max(finite)))
-        line, = ax.plot(
-            x,
-            y,
-            linewidth=line_width,
-            color=style.color,
-            linestyle=style.linestyle,
-            alpha=0.9,
-            marker=style.marker,
-            markersize=marker_size,
-            markevery=1,
-        )
-        fam_handles.setdefault(record.family, line)
+        bounds = item.avg_bounds
+        if bounds is not None:
+            y_min = min(y_min, bounds[0])
+            y_max = max(y_max, bounds[1])
+        curves.append((item.family, x, y))
 
     if not any_data:
         plt.close(fig)
         return
+    fam_handles = _draw_family_overlay(ax, curves, styles, line_width, marker_size)
 
     ax.set_xscale("log")
     ax.set_yscale("log")
@@ -538,12 +941,12 @@ def plot_combined_avg_weights(
     fig.tight_layout()
     legend_path = path.with_name(f"{path.stem}_legend.png")
     _save_legend_image(handles, labels, legend_path, title="family", fontsize=fontsize)
-    fig.savefig(path.as_posix(), dpi=300, bbox_inches="tight")
+    fig.savefig(path.as_posix(), dpi=300, pil_kwargs=PNG_PIL_KWARGS)
     plt.close(fig)
 
 
 def plot_family_curves(
-    series: Sequence[ComponentSeries],
+    curves_by_file: Sequence[PlotCurves],
     family: str,
     style: FamilyStyle,
     out_dir: Path,
@@ -551,7 +954,7 @@ def plot_family_curves(
     fontsize: float,
 ) -> None:
     """Write per-family coverage and weight plots with legend keyed by file ID."""
-    family_series = [record for record in series if record.family == family]
+    family_series = sorted((item for item in curves_by_file if item.family == family), key=lambda item: item.identifier)
     if not family_series:
         return
 
@@ -560,8 +963,8 @@ def plot_family_curves(
     any_coverage = False
     legend_handles_cov: List[Any] = []
     line_width_cov, marker_size_cov = _style_sizes(fontsize, base_line=1.3, base_marker=3.0)
-    for idx, record in enumerate(sorted(family_series, key=lambda item: item.identifier)):
-        x, y = record.coverage_curve()
+    for idx, item in enumerate(family_series):
+        x, y = item.coverage
         if x.size == 0:
             continue
         any_coverage = True
@@ -577,7 +980,7 @@ def plot_family_curves(
             marker=style.marker,
             markersize=marker_size_cov,
             markevery=1,
-            label=record.identifier,
+            label=item.identifier,
         )
         legend_handles_cov.append(line)
     if any_coverage:
@@ -591,7 +994,7 @@ def plot_family_curves(
         legend_path_cov = coverage_path.with_name(f"{coverage_path.stem}_legend.png")
         _save_legend_image(legend_handles_cov, legend_labels_cov, legend_path_cov, title="file id", fontsize=fontsize)
         fig_cov.tight_layout()
-        fig_cov.savefig(coverage_path.as_posix(), dpi=300, bbox_inches="tight")
+        fig_cov.savefig(coverage_path.as_posix(), dpi=300, pil_kwargs=PNG_PIL_KWARGS)
     plt.close(fig_cov)
 
     avg_path = out_dir / f"topn_avg_min_internal_weight_{_slugify(family)}.png"
@@ -602,20 +1005,19 @@ def plot_family_curves(
     plotted = 0
     legend_handles_avg: List[Any] = []
     line_width_avg, marker_size_avg = _style_sizes(fontsize, base_line=1.3, base_marker=3.0)
-    for idx, record in enumerate(sorted(family_series, key=lambda item: item.identifier)):
-        curve = record.avg_weight_curve()
-        if curve is None:
+    for idx, item in enumerate(family_series):
+        if item.avg_weight is None:
             continue
-        x, y = curve
+        x, y = item.avg_weight
         if x.size == 0:
             continue
         any_avg = True
         plotted += 1
         # Track extrema so the family-specific log-scale remains informative.
-        finite = y[np.isfinite(y) & (y > 0)]
-        if finite.size > 0:
-            y_min = min(y_min, float(np.min(finite)))
-            y_max = max(y_max, float(np.max(finite)))
+        bounds = item.avg_bounds
+        if bounds is not None:
+            y_min = min(y_min, bounds[0])
+            y_max = max(y_max, bounds[1])
         # Rotate per-trace line styles to keep densely plotted families legible.
         linestyle = LINESTYLES[idx % len(LINESTYLES)]
         line, = ax_avg.plot(
@@ -628,7 +1030,7 @@ def plot_family_curves(
             marker=style.marker,
             markersize=marker_size_avg,
             markevery=1,
-            label=record.identifier,
+            label=item.identifier,
         )
         legend_handles_avg.append(line)
     if any_avg:
@@ -653,10 +1055,23 @@ def plot_family_curves(
         legend_path_avg = avg_path.with_name(f"{avg_path.stem}_legend.png")
         _save_legend_image(legend_handles_avg, legend_labels_avg, legend_path_avg, title="file id", fontsize=fontsize)
         fig_avg.tight_layout()
-        fig_avg.savefig(avg_path.as_posix(), dpi=300, bbox_inches="tight")
+        fig_avg.savefig(avg_path.as_posix(), dpi=300, pil_kwargs=PNG_PIL_KWARGS)
     plt.close(fig_avg)
 
 
+def _render_plots(tasks: Sequence[Tuple[Callable[..., None], Tuple[Any, ...]]], jobs: int) -> None:
+    """Run independent plot tasks, in worker processes when *jobs* > 1 (each owns its figures)."""
+    workers = min(jobs, len(tasks))
+    if workers <= 1:
+        for plot_fn, plot_args in tasks:
+            plot_fn(*plot_args)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(plot_fn, *plot_args) for plot_fn, plot_args in tasks]
+        for future in futures:
+            future.result()
+
+
 def main(argv: Optional[Sequence[str]] = None) -> None:
     """Script entry point handling argument parsing and plotting pipeline."""
     parser = argparse.ArgumentParser(
@@ -671,7 +1086,13 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     parser.add_argument("--results-csv", type=Path, default=Path(DEFAULT_RESULTS_CSV), help="Path to segmentation_results.csv for additional filtering")
     parser.add_argument("--filter-config", type=Path, default=Path(DEFAULT_FILTER_CONFIG), help="JSON file with numeric min/max thresholds against segmentation_results.csv")
     parser.add_argument("--exclude-families", type=str, nargs="*", default=None, help="List of family names to exclude from plots")
+    parser.add_argument("-j", "--jobs", type=int, default=0, help="Worker processes for loading CSVs and rendering plots (0 = one per CPU, 1 = serial)")
+    parser.add_argument("--no-cache", action="store_true", help="Always re-parse CSVs instead of using/writing sidecar *.sizes.npz caches")
+    parser.add_argument("--no-weights", action="store_true", help="Skip min_internal_weight entirely: parse only sizes and draw coverage plots only")
     args = parser.parse_args(args=argv)
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+    jobs = args.jobs or os.cpu_count() or 1
 
     ensure_dir(args.outdir)
 
@@ -684,12 +1105,20 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     results_index: Optional[ResultsIndex] = None
     if filter_cfg:
         try:
-            results_index = _load_results_index(args.results_csv)
+            results_index = _load_results_index(args.results_csv, filter_cfg)
         except Exception as exc:
             print(f"Failed to load results CSV for filtering: {exc}")
             results_index = None
 
-    series = load_component_series(csv_paths, in_root, filter_cfg, results_index)
+    series = load_component_series(
+        csv_paths,
+        in_root,
+        filter_cfg,
+        results_index,
+        use_cache=not args.no_cache,
+        jobs=jobs,
+        load_weights=not args.no_weights,
+    )
     if not series:
         print("No valid component sizes to plot.")
         return
@@ -710,8 +1139,20 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     prefix = args.title or "component size distribution"
     total_files = len(series)
 
-    plot_combined_coverage(series, valid_families, styles, args.outdir, prefix, total_files, args.fontsize)
-    plot_combined_avg_weights(series, valid_families, styles, args.outdir, prefix, total_files, args.fontsize)
+    # Tasks get the log-sampled curves they draw (not the series and their full-length arrays),
+    # so pickling to workers stays bounded by PLOT_MAX_POINTS per file.
+    valid_set = set(valid_families)
+    valid_curves = [_plot_curves(record) for record in series if record.family in valid_set]
+    curves_by_family: Dict[str, List[PlotCurves]] = {}
+    for item in valid_curves:
+        curves_by_family.setdefault(item.family, []).append(item)
+    tasks: List[Tuple[Callable[..., None], Tuple[Any, ...]]] = [
+        (plot_combined_coverage, (valid_curves, valid_families, styles, args.outdir, prefix, total_files, args.fontsize)),
+    ]
+    if not args.no_weights:
+        tasks.append(
+            (plot_combined_avg_weights, (valid_curves, valid_families, styles, args.outdir, prefix, total_files, args.fontsize))
+        )
 
     family_outdir = args.outdir / "families"
     ensure_dir(family_outdir)
@@ -719,7 +1160,8 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
         style = styles.get(family)
         if style is None:
             continue
-        plot_family_curves(series, family, style, family_outdir, prefix, args.fontsize)
+        tasks.append((plot_family_curves, (curves_by_family[family], family, style, family_outdir, prefix, args.fontsize)))
+    _render_plots(tasks, jobs)
 
     print(f"Wrote plots to {args.outdir}")
     print(f"Legend ID map: {id_map_path}")
@@ -13,7 +13,7 @@ from matplotlib.artist import Artist
 import numpy as np
 import pandas as pd
 
-from family_map_utils import families_for_csvs
+from family_map_utils import extract_hash_from_filename, load_family_map
 from plot_styles import build_family_styles
 
 DEFAULT_META = Path("benchmarks/sc2024/meta.csv")
@@ -41,6 +41,7 @@ def save_legend_figure(
     columns: int,
     title: Optional[str] = None,
     fontsize: float = 10.0,
+    dpi: int = 300,
 ) -> Optional[Path]:
     """Persist legend entries as a standalone figure."""
     if not handles or not labels:
@@ -63,7 +64,7 @@ def save_legend_figure(
         title_fontsize=fontsize,
     )
     fig.tight_layout()
-    fig.savefig(out_path.as_posix(), dpi=300, bbox_inches="tight")
+    fig.savefig(out_path.as_posix(), dpi=dpi, bbox_inches="tight")
     plt.close(fig)
     return out_path
 
@@ -74,35 +75,33 @@ def attach_families(frame: pd.DataFrame, meta_csv: Path) -> pd.Series:
         raise ValueError("CSV must include a 'file' column for hash lookup")
     if not meta_csv.exists():
         print(f"Warning: meta file {meta_csv} not found; labelling families as 'unknown'.")
-        return pd.Series(["unknown"] * len(frame))
+        return pd.Series("unknown", index=frame.index)
 
-    paths = [Path(str(name)) for name in frame["file"].astype(str)]
-    fam_map = families_for_csvs(paths, meta_csv)
-    return pd.Series([fam_map.get(path, "unknown") for path in paths])
+    # Index-aligned with *frame* so callers can assign() the result onto filtered rows.
+    fam_map = load_family_map(meta_csv)
+    hashes = frame["file"].astype(str).fillna("").map(extract_hash_from_filename)
+    return hashes.map(fam_map).fillna("unknown")
 
 
 def compute_marker_sizes(frame: pd.DataFrame, size_column: Optional[str]) -> pd.Series:
     """Scale marker sizes from a numeric column or return a constant size."""
-    base = pd.Series(80.0, index=frame.index, dtype=float)
+    sizes = np.full(len(frame), 80.0)
     if size_column is None:
-        return base
+        return pd.Series(sizes, index=frame.index)
     if size_column not in frame.columns:
         raise ValueError(f"Column '{size_column}' not found for marker sizing")
 
-    values = pd.to_numeric(frame[size_column], errors="coerce")
-    mask = values.replace([np.inf, -np.inf], np.nan).notna()
-    if not mask.any():
-        return base
-
-    valid = values[mask]
-    span = float(valid.max() - valid.min())
-    if span <= 1e-12:
-        base.loc[mask] = 160.0
-        return base
-
-    norm = (valid - float(valid.min())) / span
-    base.loc[mask] = norm * 160.0 + 40.0
-    return base
+    values = pd.to_numeric(frame[size_column], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    finite = np.isfinite(values)
+    if finite.any():
+        valid = values[finite]
+        low = float(valid.min())
+        span = float(valid.max()) - low
+        if span <= 1e-12:
+            sizes[finite] = 160.0
+        else:
+            sizes[finite] = (valid - low) / span * 160.0 + 40.0
+    return pd.Series(sizes, index=frame.index)
 
 
 def filter_numeric(frame: pd.DataFrame, x_col: str, y_col: str) -> pd.DataFrame:
@@ -111,8 +110,9 @@ def filter_numeric(frame: pd.DataFrame, x_col: str, y_col: str) -> pd.DataFrame:
         missing = [col for col in (x_col, y_col) if col not in frame.columns]
         raise ValueError(f"CSV missing required columns: {', '.join(missing)}")
 
-    subset = frame[[x_col, y_col]].apply(pd.to_numeric, errors="coerce")
-    mask = np.isfinite(subset[x_col]) & np.isfinite(subset[y_col])
+    x_values = pd.to_numeric(frame[x_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    y_values = pd.to_numeric(frame[y_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    mask = np.isfinite(x_values) & np.isfinite(y_values)
     return frame.loc[mask].copy()
 
 
@@ -130,6 +130,7 @@ def plot_scatter(
     x_limits: Optional[Tuple[float, float]],
     y_limits: Optional[Tuple[float, float]],
     fontsize: float,
+    dpi: int = 300,
 ) -> Optional[Path]:
     """Render and save the scatter plot grouped by family."""
     filtered = filter_numeric(frame, x_col, y_col)
@@ -148,28 +149,37 @@ def plot_scatter(
 
     styles = build_family_styles(filtered["family"].astype(str).tolist())
 
+    # Positional row indices per family (sorted names, rows in frame order) as groupby would yield.
+    x_values = pd.to_numeric(filtered[x_col], errors="coerce").to_numpy(dtype=np.float64)
+    y_values = pd.to_numeric(filtered[y_col], errors="coerce").to_numpy(dtype=np.float64)
+    size_values = sizes.to_numpy()
+    family_codes, family_names = pd.factorize(filtered["family"], sort=True)
+    order = np.argsort(family_codes, kind="stable")
+    bounds = np.cumsum(np.bincount(family_codes, minlength=len(family_names)))[:-1]
+
     fig, ax = plt.subplots(figsize=(10, 7))
     legend_handles = []
     legend_labels = []
-    for family, group in filtered.groupby("family"):
-        family_name = str(family)
+    for family_name, idx in zip(family_names, np.split(order, bounds)):
         style = styles.get(family_name)
         if style is None:
             # Fallback for unexpected family names
             style = build_family_styles([family_name])[family_name]
         handle = ax.scatter(
-            group[x_col],
-            group[y_col],
-            s=sizes.loc[group.index],
+            x_values[idx],
+            y_values[idx],
+            s=size_values[idx],
             color=style.color,
             marker=style.marker,
             edgecolors="black",
             linewidths=0.4,
             alpha=0.85,
-            label=f"{family_name} (n={len(group)})",
+            label=f"{family_name} (n={len(idx)})",
+            # Flatten the markers into one image for PDF/SVG output; no effect on PNG.
+            rasterized=True,
         )
         legend_handles.append(handle)
-        legend_labels.append(f"{family_name} (n={len(group)})")
+        legend_labels.append(f"{family_name} (n={len(idx)})")
 
     ax.set_xlabel(x_col, fontsize=fontsize)
     ax.set_ylabel(y_col, fontsize=fontsize)
@@ -203,7 +213,7 @@ def plot_scatter(
     fig.tight_layout()
 
     ensure_parent(out_path)
-    fig.savefig(out_path.as_posix(), dpi=300, bbox_inches="tight")
+    fig.savefig(out_path.as_posix(), dpi=dpi, bbox_inches="tight")
     plt.close(fig)
     if legend_handles:
         legend_path = legend_output_path(out_path)
@@ -214,6 +224,7 @@ def plot_scatter(
             columns=legend_columns,
             title="family",
             fontsize=fontsize,
+            dpi=dpi,
         )
     return None
 
@@ -243,6 +254,7 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         default=10.0,
         help="Font size (points) for axis labels, ticks, and legends",
     )
+    parser.add_argument("--dpi", type=int, default=300, help="Resolution of the saved plot and legend images")
     parser.add_argument(
         "--x-limits",
         type=float,
@@ -284,6 +296,7 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
         x_limits=tuple(args.x_limits) if args.x_limits else None,
         y_limits=tuple(args.y_limits) if args.y_limits else None,
         fontsize=float(args.fontsize),
+        dpi=args.dpi,
     )
     print(f"Wrote scatter plot to {out_path}")
     if legend_path:
@@ -17,8 +17,8 @@ def ensure_dir(p: str):
     os.makedirs(p, exist_ok=True)
 
 
-def tau_label_and_order(df: pd.DataFrame) -> List[str]:
-    """Add tau_label and tau_norm columns (∞ for -1), return ordered labels."""
+def add_tau_columns(df: pd.DataFrame) -> None:
+    """Add tau_label and tau_norm columns (∞ for -1) in place."""
     # Normalize tau to int with -1 representing infinity
     def to_norm(x):
         try:
@@ -30,7 +30,10 @@ def tau_label_and_order(df: pd.DataFrame) -> List[str]:
 
     df["tau_norm"] = df["tau"].apply(to_norm)
     df["tau_label"] = df["tau_norm"].apply(lambda v: "∞" if v == -1 else ("nan" if pd.isna(v) else str(int(v))))
-    # Order taus numerically with infinity last
+
+
+def ordered_tau_labels(df: pd.DataFrame) -> List[str]:
+    """Return tau labels present in df (see add_tau_columns), ordered numerically with ∞ last."""
     work = df[["tau_label", "tau_norm"]].drop_duplicates().copy()
     work["sort_key"] = work["tau_norm"].apply(lambda v: float("inf") if v == -1 else v)
     work = work.sort_values("sort_key")
@@ -75,8 +78,8 @@ def load(csv_path: str) -> pd.DataFrame:
     else:
         df["comps_frac"] = np.nan
 
-    # Tau labels and order
-    _ = tau_label_and_order(df)
+    # Tau labels (ordering is taken after any filtering in main)
+    add_tau_columns(df)
     return df
 
 
@@ -122,7 +125,7 @@ def main():
     if args.impl:
         df = df[df["impl"] == args.impl]
 
-    tau_order = tau_label_and_order(df)
+    tau_order = ordered_tau_labels(df)
 
     # Heatmap 1: seg_sec as fraction of total_sec
     pt_seg = pivot_tau_k_mean(df, "seg_frac", tau_order)
@@ -17,8 +17,8 @@ def ensure_dir(p: str):
     os.makedirs(p, exist_ok=True)
 
 
-def tau_label_and_order(df: pd.DataFrame) -> List[str]:
-    """Add tau_label and tau_norm columns (∞ for -1), return ordered labels."""
+def add_tau_columns(df: pd.DataFrame) -> None:
+    """Add tau_label and tau_norm columns (∞ for -1) in place."""
     # Normalize tau to int with -1 representing infinity
     def to_norm(x):
         try:
@@ -30,7 +30,10 @@ def tau_label_and_order(df: pd.DataFrame) -> List[str]:
 
     df["tau_norm"] = df["tau"].apply(to_norm)
     df["tau_label"] = df["tau_norm"].apply(lambda v: "∞" if v == -1 else ("nan" if pd.isna(v) else str(int(v))))
-    # Order taus numerically with infinity last
+
+
+def ordered_tau_labels(df: pd.DataFrame) -> List[str]:
+    """Return tau labels present in df (see add_tau_columns), ordered numerically with ∞ last."""
     work = df[["tau_label", "tau_norm"]].drop_duplicates().copy()
     work["sort_key"] = work["tau_norm"].apply(lambda v: float("inf") if v == -1 else v)
     work = work.sort_values("sort_key")
@@ -69,8 +72,8 @@ def load(csv_path: str) -> pd.DataFrame:
 
     # No components metrics in vig_info_results; nothing to compute here
 
-    # Tau labels and order
-    _ = tau_label_and_order(df)
+    # Tau labels (ordering is taken after any filtering in main)
+    add_tau_columns(df)
     return df
 
 
@@ -227,7 +230,7 @@ def main():
         impl_title = f" [impl={args.impl}]" if args.impl else ""
         impl_suffix = f"_{args.impl}" if args.impl else ""
 
-    tau_order = tau_label_and_order(df)
+    tau_order = ordered_tau_labels(df)
 
     # Determine if we should omit thread-related plots (naive impl)
     naive_impl = (impl_norm == "naive") if impl_norm else False
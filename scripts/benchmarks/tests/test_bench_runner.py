@@ -1,6 +1,7 @@
 import os
 import tempfile
 import csv
+import json
 import types
 from argparse import Namespace
 from pathlib import Path
@@ -57,6 +58,64 @@ class TestBenchRunnerCore(unittest.TestCase):
         self.assertIn({"threads": "1", "impl": "naive"}, combos)
         self.assertIn({"threads": "1", "impl": "opt", "maxbuf": "10"}, combos)
 
+    def test_parse_required_keys_uses_last_complete_summary(self):
+        lines = ["x=0 y=0", "x=1 y=2 z=3", "progress p=5", ""]
+        self.assertEqual(br._parse_required_keys(lines, ["x", "y"]), {"x": "1", "y": "2", "z": "3"})
+        self.assertIsNone(br._parse_required_keys(lines, ["missing"]))
+        self.assertEqual(br.parse_summary_lines(lines), {"p": "5"})
+
+    def test_scan_log_for_summary_reads_past_the_tail(self):
+        with tempfile.TemporaryDirectory() as td:
+            log = Path(td) / "run.log"
+            header = "# bench_runner header\n{\"cmd\": \"x=9 y=9\"}\n"
+            trace = "".join(f"trace line {i}\n" for i in range(50000))
+            log.write_text(header + "x=0 y=0\nx=1 y=2\n" + trace + "partial")
+            self.assertEqual(br.scan_log_for_summary(log, ["x", "y"], len(header.encode())), {"x": "1", "y": "2"})
+            # the header is never searched
+            log.write_text(header + trace)
+            self.assertIsNone(br.scan_log_for_summary(log, ["x", "y"], len(header.encode())))
+
+    def test_list_bench_files_recursive_and_sorted(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "a" / "b").mkdir(parents=True)
+            for rel in ("z.cnf", "a/y.cnf.xz", "a/b/x.cnf", "a/notes.txt", "a/b/x.cnf.gz"):
+                (root / rel).write_text("")
+            files = br.list_bench_files(root)
+            self.assertEqual(files, sorted([root / "z.cnf", root / "a/y.cnf.xz", root / "a/b/x.cnf"]))
+
+    def test_csv_appender_writes_header_once(self):
+        with tempfile.TemporaryDirectory() as td:
+            csv_path = Path(td) / "res.csv"
+            app = br.CsvAppender(flush_rows=1000, flush_interval=1e9)
+            app.append(csv_path, ["a", "b"], ["1", "x,y"])
+            app.append(csv_path, ["a", "b"], ["2", "z"])
+            app.close()
+            app = br.CsvAppender()
+            app.append(csv_path, ["a", "b"], ["3", ""])
+            app.close()
+            with csv_path.open(newline="") as f:
+                rows = list(csv.reader(f))
+            self.assertEqual(rows, [["a", "b"], ["1", "x,y"], ["2", "z"], ["3", ""]])
+
+    def test_config_rejects_bad_cache_max_bytes(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "bench").mkdir()
+            (root / "bench" / "toy.cnf").write_text("p cnf 1 0\n")
+            for bad in ("10G", -1, [1]):
+                cfg = {
+                    "out_dir": str(root / "out"),
+                    "bench_dir": str(root / "bench"),
+                    "files": {"count": 1},
+                    "algorithms": [{"name": "toy"}],
+                    "cache": {"persistent": True, "max_bytes": bad},
+                }
+                cfg_path = root / "cfg.json"
+                cfg_path.write_text(json.dumps(cfg))
+                with self.assertRaises(br.ConfigError):
+                    br.run_from_config(cfg_path)
+
 
 class TestRunAlgorithmSkipExisting(unittest.TestCase):
     def setUp(self):
@@ -105,7 +164,7 @@ class TestRunAlgorithmSkipExisting(unittest.TestCase):
         # Patch the runner to avoid executing external binaries
         self._orig_runner = br.run_with_streaming
 
-        def fake_run(cmd, infile, log_path, verbose, memlimit_mb=None):
+        def fake_run(cmd, infile, log_path, verbose, memlimit_mb=None, log_header=None):
             # Simulate tool output lines with required keys
             # Echo the chosen foo/bar if present
             foo = None
@@ -142,6 +201,13 @@ class TestRunAlgorithmSkipExisting(unittest.TestCase):
             rows2 = list(csv.reader(f))
         self.assertEqual(len(rows1), len(rows2))
 
+    def test_out_of_range_key_cols_is_a_config_error(self):
+        for bad in ([0, 6], [-1], ["file"], 0):
+            cfg = dict(self.algo_cfg, csv=dict(self.algo_cfg["csv"], key_cols=bad))
+            with self.assertRaises(br.ConfigError):
+                br.run_algorithm_from_registry("toy", Namespace(**vars(self.ns)), cfg)
+        self.assertFalse((self.out_dir / "toy_results.csv").exists())
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
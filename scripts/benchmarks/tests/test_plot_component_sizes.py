@@ -0,0 +1,174 @@
+import contextlib
+import io
+import os
+import tempfile
+from pathlib import Path
+import unittest
+from unittest import mock
+
+import numpy as np
+
+# Ensure we can import the plot_component_sizes module
+import sys as _sys
+# Repo root is three levels up from tests/: tests -> benchmarks -> scripts -> repo
+_ROOT = Path(__file__).resolve().parents[3]
+_sys.path.insert(0, str(_ROOT / "scripts/benchmarks"))
+
+import plot_component_sizes as pcs  # type: ignore
+
+
+def _write_components(path: Path, sizes, weights) -> None:
+    lines = ["component,size,min_internal_weight"]
+    lines += [f"{i},{s},{w}" for i, (s, w) in enumerate(zip(sizes, weights))]
+    path.write_text("\n".join(lines) + "\n")
+
+
+class TestComponentCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self.tmpdir.name) / "abc-inst_components.csv"
+        # Large enough to be cached (files under CACHE_MIN_BYTES are always parsed)
+        self.sizes = np.arange(1, 5001)
+        _write_components(self.csv_path, self.sizes, self.sizes / 7.0)
+        self.assertGreaterEqual(self.csv_path.stat().st_size, pcs.CACHE_MIN_BYTES)
+        self.cache = pcs._cache_path(self.csv_path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_miss_writes_cache_and_hit_skips_parsing(self):
+        self.assertFalse(self.cache.exists())
+        first = pcs._load_component_arrays(self.csv_path)
+        self.assertTrue(self.cache.exists())
+        self.assertEqual(sorted(first.sizes.tolist()), self.sizes.tolist())
+        self.assertIsNotNone(first.avg_weight)
+
+        with mock.patch.object(pcs, "_parse_component_arrays", side_effect=AssertionError("parsed on cache hit")):
+            second = pcs._load_component_arrays(self.csv_path)
+        np.testing.assert_array_equal(second.sizes, first.sizes)
+        np.testing.assert_array_equal(second.weights, first.weights)
+        np.testing.assert_array_equal(second.coverage, first.coverage)
+        np.testing.assert_array_equal(second.avg_weight, first.avg_weight)
+        # No temp files are left behind by the atomic write
+        self.assertEqual(sorted(p.name for p in self.csv_path.parent.iterdir()), [self.csv_path.name, self.cache.name])
+
+    def test_stale_stamp_after_csv_change_reparses(self):
+        pcs._load_component_arrays(self.csv_path)
+        old_stamp = np.load(self.cache)["stamp"].tolist()
+        _write_components(self.csv_path, [9, 8, 7] * 2000, [1.0] * 6000)
+        st = self.csv_path.stat()
+        os.utime(self.csv_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        arrays = pcs._load_component_arrays(self.csv_path)
+        self.assertEqual(sorted(set(arrays.sizes.tolist())), [7, 8, 9])
+        new_stamp = np.load(self.cache)["stamp"].tolist()
+        self.assertNotEqual(new_stamp, old_stamp)
+        self.assertEqual(new_stamp[1:], [self.csv_path.stat().st_mtime_ns, self.csv_path.stat().st_size])
+
+    def test_no_weights_never_writes_cache(self):
+        arrays = pcs._load_component_arrays(self.csv_path, load_weights=False)
+        self.assertIsNone(arrays.weights)
+        self.assertIsNone(arrays.avg_weight)
+        self.assertFalse(self.cache.exists())
+
+        # A cache written by a weighted run is reused, but weights are dropped
+        pcs._load_component_arrays(self.csv_path)
+        mtime = self.cache.stat().st_mtime_ns
+        arrays = pcs._load_component_arrays(self.csv_path, load_weights=False)
+        self.assertIsNone(arrays.weights)
+        self.assertIsNone(arrays.avg_weight)
+        self.assertEqual(self.cache.stat().st_mtime_ns, mtime)
+
+
+class TestComponentParsing(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _parse_both(self, text: str):
+        path = self.root / "x_components.csv"
+        path.write_text(text)
+        results = {}
+        if pcs._pyarrow_csv() is not None:
+            results["arrow"] = pcs._parse_sizes_and_weights(path)
+        with mock.patch.object(pcs, "_pyarrow_csv", return_value=None):
+            results["pandas"] = pcs._parse_sizes_and_weights(path)
+        return results
+
+    def test_readers_agree_on_blank_fractional_and_non_numeric_sizes(self):
+        cases = {
+            # (csv body, expected sizes, expected weights)
+            "integers": ("size,min_internal_weight\n3,1.5\n0,2\n5,\n", [3, 5], [1.5, np.nan]),
+            "blank": ("size,min_internal_weight\n3,1\n,2\n4,3\n", [3, 4], [1.0, 3.0]),
+            "fractional": ("size,min_internal_weight\n2.7,1\n0.5,2\n5,3\n", [2, 5], [1.0, 3.0]),
+            "non-numeric": ("size,min_internal_weight\n3,1\nabc,2\n4,x\n", [3, 4], [1.0, np.nan]),
+            "no weights column": ("size\n3\n,\n4\n", [3, 4], None),
+        }
+        for name, (text, want_sizes, want_weights) in cases.items():
+            for reader, (sizes, weights) in self._parse_both(text).items():
+                with self.subTest(case=name, reader=reader):
+                    self.assertEqual(sizes.dtype.kind, "i")
+                    self.assertEqual(sizes.tolist(), want_sizes)
+                    if want_weights is None:
+                        self.assertIsNone(weights)
+                    else:
+                        np.testing.assert_array_equal(weights, want_weights)
+
+
+class TestResultsIndexFilters(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.results = self.root / "segmentation_results.csv"
+        self.results.write_text(
+            "file,comps,modularity\n"
+            "aaa-ok.cnf.xz,50,0.5\n"
+            "bbb-blank.cnf.xz,,0.5\n"
+            "ccc-text.cnf.xz,many,0.5\n"
+            "ddd-low.cnf.xz,10,0.5\n"
+            "eee-high.cnf.xz,50,0.9\n"
+            "eee-high.cnf.xz,50,0.6\n"
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _skip_reason(self, index, flt, hash_id):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            passed = pcs._passes_results_filters(self.root / f"{hash_id}-x_components.csv", flt, index)
+        return passed, out.getvalue().strip()
+
+    def test_passing_set_and_skip_reasons(self):
+        flt = {"min": {"comps": 30.0}, "max": {"modularity": 0.7}}
+        index = pcs._load_results_index(self.results, flt)
+        # Blank cells compare False and pass; the last row of a duplicated file wins
+        self.assertEqual(index.passing, frozenset({"aaa", "bbb", "eee"}))
+        for hash_id, pos in index.positions.items():
+            self.assertEqual(pcs._passes_filters(index, pos, flt)[0], hash_id in index.passing)
+
+        self.assertEqual(self._skip_reason(index, flt, "aaa"), (True, ""))
+        passed, msg = self._skip_reason(index, flt, "ccc")
+        self.assertFalse(passed)
+        self.assertIn("missing value for 'comps' (required min 30.0)", msg)
+        passed, msg = self._skip_reason(index, flt, "ddd")
+        self.assertFalse(passed)
+        self.assertIn("min filter 'comps' failed: 10.0 < 30.0", msg)
+        passed, msg = self._skip_reason(index, flt, "zzz")
+        self.assertFalse(passed)
+        self.assertIn("no results row for hash zzz", msg)
+
+    def test_missing_filter_column_rejects_every_row(self):
+        flt = {"min": {"keff": 1.0}, "max": {}}
+        index = pcs._load_results_index(self.results, flt)
+        self.assertEqual(index.passing, frozenset())
+        passed, msg = self._skip_reason(index, flt, "aaa")
+        self.assertFalse(passed)
+        self.assertIn("missing value for 'keff' (required min 1.0)", msg)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)